@@ -1,7 +1,7 @@
 """ChainBuilder algorithm for connecting points into chains."""
 
 import random
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.models.chain import Chain
 from src.models.grid import Grid
@@ -29,6 +29,15 @@ class ChainBuilder:
         self.max_chain_length = max_chain_length
         self.chains: List[Chain] = []
         self.next_chain_id = 0
+
+        # Unconnected points and, per point, its number of unconnected
+        # neighbors plus a small random offset that breaks ties; both are kept
+        # in sync as points join chains
+        self._unconnected: Set[Point] = set()
+        self._neighbor_score: Dict[Point, float] = {}
+        # Unconnected points with no unconnected neighbors left
+        self._isolated: Set[Point] = set()
+        self._init_tracking()
         
         # Animation state
         self.current_chain: Optional[Chain] = None
@@ -47,21 +56,20 @@ class ChainBuilder:
         self.grid.reset_connections()
         self.chains = []
         self.next_chain_id = 0
+        self._init_tracking()
 
         max_attempts = 1000
         attempts = 0
 
-        while self.grid.get_unconnected_points() and attempts < max_attempts:
+        unconnected = self._unconnected
+        while unconnected and attempts < max_attempts:
             attempts += 1
-            unconnected = self.grid.get_unconnected_points()
-
-            if not unconnected:
-                break
 
             # Start a new chain from a random unconnected point
             start_point = self._select_start_point(unconnected)
             chain = self._create_new_chain()
             chain.add_point(start_point)
+            self._mark_connected(start_point)
 
             # Extend the chain as much as possible
             self._extend_chain(chain)
@@ -70,8 +78,8 @@ class ChainBuilder:
                 self.chains.append(chain)
 
         # Verify all points are connected
-        if self.grid.get_unconnected_points():
-            unconnected_count = len(self.grid.get_unconnected_points())
+        if unconnected:
+            unconnected_count = len(unconnected)
             raise RuntimeError(
                 f"Failed to connect all points. "
                 f"{unconnected_count} points remain unconnected."
@@ -84,6 +92,7 @@ class ChainBuilder:
         self.grid.reset_connections()
         self.chains = []
         self.next_chain_id = 0
+        self._init_tracking()
         self.current_chain = None
         self.animation_step = 0
         self.is_building = True
@@ -97,7 +106,7 @@ class ChainBuilder:
         if not self.is_building:
             return False
             
-        unconnected = self.grid.get_unconnected_points()
+        unconnected = self._unconnected
         if not unconnected:
             self.is_building = False
             return False
@@ -107,14 +116,19 @@ class ChainBuilder:
             start_point = self._select_start_point(unconnected)
             self.current_chain = self._create_new_chain()
             self.current_chain.add_point(start_point)
+            self._mark_connected(start_point)
             return True
             
         # Try to extend current chain
-        next_point = self._find_best_next_point(self.current_chain)
-        if next_point is not None and not self.current_chain.is_full:
-            success = self._add_point_to_chain(self.current_chain, next_point)
-            if success:
-                return True
+        if not self.current_chain.is_full:
+            candidate = self._find_best_next_point(self.current_chain)
+            if candidate is not None:
+                endpoint, next_point = candidate
+                success = self._add_point_to_chain(
+                    self.current_chain, next_point, endpoint
+                )
+                if success:
+                    return True
                 
         # Current chain is complete, add it and start a new one
         if self.current_chain.length > 0:
@@ -122,7 +136,7 @@ class ChainBuilder:
         self.current_chain = None
         
         # Check if we still have unconnected points
-        return len(self.grid.get_unconnected_points()) > 0
+        return bool(self._unconnected)
 
     def is_animation_complete(self) -> bool:
         """Check if the animation is complete.
@@ -130,30 +144,23 @@ class ChainBuilder:
         Returns:
             True if all points are connected
         """
-        return not self.is_building and len(self.grid.get_unconnected_points()) == 0
+        return not self.is_building and not self._unconnected
 
-    def _select_start_point(self, unconnected_points: List[Point]) -> Point:
+    def _select_start_point(self, unconnected_points: Set[Point]) -> Point:
         """Select the best starting point for a new chain.
 
         Args:
-            unconnected_points: List of available unconnected points
+            unconnected_points: Set of available unconnected points
 
         Returns:
             The selected starting point
         """
         # Strategy: prefer points with fewer unconnected neighbors
-        # This helps avoid creating isolated points
-        best_point = unconnected_points[0]
-        min_unconnected_neighbors = float("inf")
-
-        for point in unconnected_points:
-            neighbors = self.grid.get_neighbors(point)
-            unconnected_neighbors = [n for n in neighbors if not n.connected]
-            if len(unconnected_neighbors) < min_unconnected_neighbors:
-                min_unconnected_neighbors = len(unconnected_neighbors)
-                best_point = point
-
-        return best_point
+        # This helps avoid creating isolated points. Zero is the minimum, so
+        # an already isolated point can be taken without scanning the rest.
+        if self._isolated:
+            return next(iter(self._isolated))
+        return min(unconnected_points, key=self._neighbor_score.__getitem__)
 
     def _create_new_chain(self) -> Chain:
         """Create a new chain with a unique ID.
@@ -172,13 +179,14 @@ class ChainBuilder:
             chain: The chain to extend
         """
         while not chain.is_full:
-            next_point = self._find_best_next_point(chain)
-            if next_point is None:
+            candidate = self._find_best_next_point(chain)
+            if candidate is None:
                 break
 
+            endpoint, next_point = candidate
             try:
                 # Use Grid's connection method to properly handle constraints
-                if self._add_point_to_chain(chain, next_point):
+                if self._add_point_to_chain(chain, next_point, endpoint):
                     pass  # Success
                 else:
                     # Could not connect due to constraints
@@ -187,135 +195,115 @@ class ChainBuilder:
                 # Could not connect (shouldn't happen if validation worked)
                 break
 
-    def _find_best_next_point(self, chain: Chain) -> Optional[Point]:
+    def _find_best_next_point(self, chain: Chain) -> Optional[Tuple[Point, Point]]:
         """Find the best next point to add to a chain.
 
         Args:
             chain: The chain to extend
 
         Returns:
-            The best next point, or None if no valid point exists
+            Tuple of (endpoint, point) where point is the best next point and
+            endpoint is the chain endpoint it can validly connect to, or None
+            if no valid point exists
         """
-        if chain.is_empty:
+        if chain.is_empty or chain.is_full:
             return None
 
-        # Get all valid candidates that can be added to this chain
-        valid_candidates = []
-        for point in self.grid.get_unconnected_points():
-            if chain.can_add_point(point):
-                # Check if adding this point would violate constraints
-                if self._would_connection_be_valid(chain, point):
-                    valid_candidates.append(point)
-
-        if not valid_candidates:
+        # Only unconnected neighbors of an open endpoint can extend the chain
+        open_endpoints = [
+            endpoint
+            for endpoint in chain.get_endpoints()
+            if endpoint.can_accept_connection()
+        ]
+        if not open_endpoints:
             return None
 
-        # Strategy: prefer points that don't create isolated regions
-        return self._select_best_neighbor(valid_candidates)
-
-    def _select_best_neighbor(self, candidates: List[Point]) -> Point:
-        """Select the best neighbor from a list of candidates.
-
-        Args:
-            candidates: List of valid neighbor points
+        # Each candidate keeps the first endpoint it can validly connect to
+        valid_candidates: Dict[Point, Point] = {}
+        for endpoint in open_endpoints:
+            candidates = [
+                neighbor
+                for neighbor in self.grid.get_neighbors(endpoint)
+                if not neighbor.connected
+                and neighbor not in valid_candidates
+                and neighbor.can_accept_connection()
+            ]
+            if not candidates:
+                continue
+            # Check all of this endpoint's candidates against the constraints
+            valid = self.grid.validate_connections(endpoint, candidates)
+            for neighbor, is_valid in zip(candidates, valid):
+                if is_valid:
+                    valid_candidates[neighbor] = endpoint
 
-        Returns:
-            The selected point
-        """
-        if len(candidates) == 1:
-            return candidates[0]
-
-        # Score each candidate based on how many unconnected neighbors it has
-        best_point = candidates[0]
-        best_score = self._score_point(best_point)
+        if not valid_candidates:
+            return None
 
-        for point in candidates[1:]:
-            score = self._score_point(point)
-            if score > best_score:
-                best_score = score
-                best_point = point
+        # Strategy: prefer points with more unconnected neighbors, which
+        # creates compact chains and avoids isolated regions
+        point = max(valid_candidates, key=self._neighbor_score.__getitem__)
+        return valid_candidates[point], point
 
-        return best_point
+    def _add_point_to_chain(self, chain: Chain, point: Point, endpoint: Point) -> bool:
+        """Add a point to a chain using Grid's constraint-aware methods.
 
-    def _score_point(self, point: Point) -> float:
-        """Score a point based on strategic value.
+        Start points are not added here: they go through Chain.add_point,
+        which raises ValueError for a chain that cannot hold any points.
 
         Args:
-            point: The point to score
+            chain: The chain to extend
+            point: The point to add
+            endpoint: Chain endpoint to connect the point to, as returned by
+                _find_best_next_point
 
         Returns:
-            Score (higher is better)
+            True if point was successfully added
         """
-        neighbors = self.grid.get_neighbors(point)
-        unconnected_neighbors = [n for n in neighbors if not n.connected]
-
-        # Prefer points with more unconnected neighbors
-        # This helps create more compact chains
-        base_score = len(unconnected_neighbors)
-
-        # Add small random component to break ties
-        random_component = random.random() * 0.1
-
-        return base_score + random_component
+        # Use Grid's connection method which handles constraints
+        if not self.grid.add_connection(endpoint, point):
+            return False
 
-    def _would_connection_be_valid(self, chain: Chain, point: Point) -> bool:
-        """Check if connecting a point to the chain would satisfy constraints.
+        # Connection successful, update chain state
+        chain._add_point_unchecked(point, endpoint)
+        self._mark_connected(point)
+        return True
 
-        Args:
-            chain: The chain to potentially extend
-            point: The point to potentially add
+    def _init_tracking(self) -> None:
+        """Rebuild the per-build bookkeeping from the grid.
 
-        Returns:
-            True if connection would be valid according to constraints
+        Resets the unconnected and isolated point sets and the neighbor
+        scores, drawing fresh tie-breaking offsets so repeated builds can still
+        produce different layouts. The offsets stay below 0.1, so they never outweigh a
+        difference of one unconnected neighbor.
         """
-        if chain.is_empty:
-            return True  # First point in chain, no connections to validate
-
-        # Find which endpoint this point would connect to
-        endpoints = chain.get_endpoints()
-
-        for endpoint in endpoints:
-            if endpoint.can_accept_connection() and point.is_adjacent_to(endpoint):
-                # Check if this specific connection would be valid
-                if self.grid.validate_connection(endpoint, point):
-                    return True
+        self._unconnected = set(self.grid.get_unconnected_points())
+        self._neighbor_score = {
+            point: sum(1 for n in self.grid.get_neighbors(point) if not n.connected)
+            + random.random() * 0.1
+            for point in self.grid.get_all_points()
+        }
+        self._isolated = {
+            point for point in self._unconnected if self._neighbor_score[point] < 1
+        }
 
-        return False
+    def _mark_connected(self, point: Point) -> None:
+        """Update the builder's bookkeeping after a point joined a chain.
 
-    def _add_point_to_chain(self, chain: Chain, point: Point) -> bool:
-        """Add a point to a chain using Grid's constraint-aware methods.
+        The chain has already set the point's ``connected`` flag, which the
+        grid tracks on its own.
 
         Args:
-            chain: The chain to extend
-            point: The point to add
-
-        Returns:
-            True if point was successfully added
+            point: The point that has just been connected
         """
-        if not chain.can_add_point(point):
-            return False
-
-        if chain.is_empty:
-            # First point in chain - no connections needed
-            point.connected = True
-            point.chain_id = chain.chain_id
-            chain.points.append(point)
-            return True
-
-        # Find which endpoint to connect to
-        endpoints = chain.get_endpoints()
-
-        for endpoint in endpoints:
-            if endpoint.can_accept_connection() and point.is_adjacent_to(endpoint):
-                # Use Grid's connection method which handles constraints
-                if self.grid.add_connection(endpoint, point):
-                    # Connection successful, update chain state
-                    point.connected = True
-                    point.chain_id = chain.chain_id
-                    chain.points.append(point)
-                    return True
-
-        return False
+        unconnected = self._unconnected
+        unconnected.discard(point)
+        self._isolated.discard(point)
+        for neighbor in self.grid.get_neighbors(point):
+            score = self._neighbor_score[neighbor] - 1
+            self._neighbor_score[neighbor] = score
+            # Scores below one mean no unconnected neighbors remain
+            if score < 1 and neighbor in unconnected:
+                self._isolated.add(neighbor)
 
     def get_coverage_stats(self) -> dict:
         """Get statistics about the current coverage.
@@ -324,8 +312,8 @@ class ChainBuilder:
             Dictionary with coverage statistics
         """
         total_points = self.grid.total_points
-        connected_points = len(self.grid.get_connected_points())
-        unconnected_points = len(self.grid.get_unconnected_points())
+        connected_points = self.grid.connected_count
+        unconnected_points = total_points - connected_points
 
         return {
             "total_points": total_points,
@@ -357,12 +345,12 @@ class ChainBuilder:
             if not chain.is_valid_chain():
                 return False
 
-        # Check that no point belongs to multiple chains
+        # Check that no point belongs to multiple chains: any repeat makes
+        # the union smaller than the total number of chain points
         seen_points: Set[Point] = set()
+        total_points = 0
         for chain in self.chains:
-            for point in chain.points:
-                if point in seen_points:
-                    return False
-                seen_points.add(point)
+            seen_points.update(chain.points)
+            total_points += len(chain.points)
 
-        return True
+        return len(seen_points) == total_points
@@ -0,0 +1,68 @@
+"""Numeric kernel for the non-crossing constraint.
+
+The segment intersection test works on plain integer coordinates, so the
+orientation tests are exact.
+"""
+
+
+def _orientation(ax: int, ay: int, bx: int, by: int, cx: int, cy: int) -> int:
+    """Get the orientation of the turn a -> b -> c.
+
+    Args:
+        ax: X coordinate of the first point
+        ay: Y coordinate of the first point
+        bx: X coordinate of the second point
+        by: Y coordinate of the second point
+        cx: X coordinate of the third point
+        cy: Y coordinate of the third point
+
+    Returns:
+        Positive for a counter-clockwise turn, negative for a clockwise turn
+        and zero if the points are collinear (twice the signed triangle area)
+    """
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def segments_intersect(
+    x1: int, y1: int, x2: int, y2: int, x3: int, y3: int, x4: int, y4: int
+) -> bool:
+    """Check if segment (x1,y1)-(x2,y2) intersects segment (x3,y3)-(x4,y4).
+
+    Coordinates are integers, so the orientation tests are exact: no division
+    and no tolerance. Segments that only touch count as intersecting.
+
+    Args:
+        x1: X coordinate of the first segment's first endpoint
+        y1: Y coordinate of the first segment's first endpoint
+        x2: X coordinate of the first segment's second endpoint
+        y2: Y coordinate of the first segment's second endpoint
+        x3: X coordinate of the second segment's first endpoint
+        y3: Y coordinate of the second segment's first endpoint
+        x4: X coordinate of the second segment's second endpoint
+        y4: Y coordinate of the second segment's second endpoint
+
+    Returns:
+        True if the segments intersect
+    """
+    o1 = _orientation(x1, y1, x2, y2, x3, y3)
+    o2 = _orientation(x1, y1, x2, y2, x4, y4)
+    o3 = _orientation(x3, y3, x4, y4, x1, y1)
+    o4 = _orientation(x3, y3, x4, y4, x2, y2)
+
+    # Segments are apart if either one lies strictly on one side of the
+    # other's line; this also rules out parallel, non-collinear segments
+    if (o1 > 0 and o2 > 0) or (o1 < 0 and o2 < 0):
+        return False
+    if (o3 > 0 and o4 > 0) or (o3 < 0 and o4 < 0):
+        return False
+    if o1 != 0 or o2 != 0 or o3 != 0 or o4 != 0:
+        return True
+
+    # All four points lie on one line, so the segments overlap exactly when
+    # their extents overlap on both axes (this covers zero-length segments)
+    return (
+        max(x1, x2) >= min(x3, x4)
+        and max(x3, x4) >= min(x1, x2)
+        and max(y1, y2) >= min(y3, y4)
+        and max(y3, y4) >= min(y1, y2)
+    )
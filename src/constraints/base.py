@@ -1,9 +1,10 @@
 """Base classes for connection constraints in the grid system."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
+    from src.constraints.manager import ConstraintManager
     from src.models.grid import Grid
     from src.models.point import Point
 
@@ -16,6 +17,8 @@ class ConnectionConstraint(ABC):
     or configured independently.
     """
 
+    __slots__ = ("name", "_enabled", "_manager")
+
     def __init__(self, name: str, enabled: bool = True) -> None:
         """Initialize the constraint.
 
@@ -24,8 +27,21 @@ class ConnectionConstraint(ABC):
             enabled: Whether this constraint is currently active
         """
         self.name = name
+        self._manager: Optional["ConstraintManager"] = None
         self.enabled = enabled
 
+    @property
+    def enabled(self) -> bool:
+        """Whether this constraint is currently active."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        # Keep the owning manager's list of enabled constraints current
+        if self._manager is not None:
+            self._manager._rebuild_enabled()
+
     @abstractmethod
     def validate(self, grid: "Grid", point1: "Point", point2: "Point") -> bool:
         """Validate whether a connection between two points is allowed.
@@ -41,6 +57,44 @@ class ConnectionConstraint(ABC):
         """
         pass
 
+    def validate_batch(
+        self, grid: "Grid", point: "Point", candidates: List["Point"]
+    ) -> List[bool]:
+        """Validate connections from one point to each of several candidates.
+
+        The default checks each candidate with ``validate``; subclasses can
+        override this with a cheaper bulk check.
+
+        Args:
+            grid: The grid containing the points
+            point: Point every proposed connection starts from
+            candidates: Other end of each proposed connection
+
+        Returns:
+            One flag per candidate, True where the connection is valid
+        """
+        return [self.validate(grid, point, candidate) for candidate in candidates]
+
+    def get_inline_check(self) -> Optional[str]:
+        """Get a Python expression equivalent to ``validate``, if there is one.
+
+        ConstraintManager splices these expressions into a single generated
+        validation function. The expression may use the names ``grid``,
+        ``p1`` and ``p2`` for the arguments of ``validate``, and must not
+        depend on state that can change without the manager being told (see
+        ``_parameters_changed``). Returning None makes the generated code call
+        ``validate`` instead.
+
+        Returns:
+            Source of a boolean expression, or None
+        """
+        return None
+
+    def _parameters_changed(self) -> None:
+        """Tell the owning manager that the result of get_inline_check changed."""
+        if self._manager is not None:
+            self._manager._compile_validator()
+
     @abstractmethod
     def get_description(self) -> str:
         """Get a human-readable description of this constraint.
@@ -75,6 +129,8 @@ class ConnectionConstraint(ABC):
 class ValidationResult:
     """Result of a constraint validation operation."""
 
+    __slots__ = ("is_valid", "constraint_name", "reason")
+
     def __init__(self, is_valid: bool, constraint_name: str, reason: str = "") -> None:
         """Initialize validation result.
 
@@ -1,7 +1,7 @@
 """Distance-based constraints for connection validation."""
 
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from src.constraints.base import ConnectionConstraint
 
@@ -10,6 +10,121 @@ if TYPE_CHECKING:
     from src.models.point import Point
 
 
+def _within_max_sq(x1: int, y1: int, x2: int, y2: int, max_sq: float) -> bool:
+    """Check whether two points are at most ``sqrt(max_sq)`` apart.
+
+    Args:
+        x1: X coordinate of the first point
+        y1: Y coordinate of the first point
+        x2: X coordinate of the second point
+        y2: Y coordinate of the second point
+        max_sq: Threshold from ``_max_squared_distance``
+
+    Returns:
+        True if the squared distance is within the threshold
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy <= max_sq
+
+
+def _within_min_sq(x1: int, y1: int, x2: int, y2: int, min_sq: float) -> bool:
+    """Check whether two points are at least ``sqrt(min_sq)`` apart.
+
+    Args:
+        x1: X coordinate of the first point
+        y1: Y coordinate of the first point
+        x2: X coordinate of the second point
+        y2: Y coordinate of the second point
+        min_sq: Threshold from ``_min_squared_distance``
+
+    Returns:
+        True if the squared distance meets the threshold
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy >= min_sq
+
+
+# Distances above this have squares beyond 2**52, where floats no longer tell
+# neighboring integers apart; the bounds below then use the float square
+_EXACT_SQUARE_LIMIT = 2.0**26
+
+
+def _max_squared_distance(max_distance: float) -> float:
+    """Get the largest squared distance that satisfies ``distance <= max_distance``.
+
+    Point coordinates are integers, so squared distances are integers and
+    validation can compare them without taking a square root. The bound is
+    derived with ``math.sqrt`` so that it agrees exactly with the unsquared
+    comparison, including limits such as ``math.sqrt(2)`` whose square is not
+    exactly representable. Beyond ``_EXACT_SQUARE_LIMIT`` the squared
+    distance itself is returned as a float.
+
+    Args:
+        max_distance: Maximum allowed distance
+
+    Returns:
+        Threshold to compare squared distances against with ``<=``
+    """
+    if not math.isfinite(max_distance):
+        return max_distance
+    if max_distance < 0:
+        return -1
+    if max_distance > _EXACT_SQUARE_LIMIT:
+        return max_distance * max_distance
+    bound = math.floor(max_distance * max_distance)
+    while math.sqrt(bound + 1) <= max_distance:
+        bound += 1
+    while bound >= 0 and math.sqrt(bound) > max_distance:
+        bound -= 1
+    return bound
+
+
+def _min_squared_distance(min_distance: float) -> float:
+    """Get the smallest squared distance that satisfies ``distance >= min_distance``.
+
+    See ``_max_squared_distance`` for why the bound is derived this way.
+
+    Args:
+        min_distance: Minimum required distance
+
+    Returns:
+        Threshold to compare squared distances against with ``>=``
+    """
+    if not math.isfinite(min_distance):
+        return min_distance
+    if min_distance <= 0:
+        return 0
+    if min_distance > _EXACT_SQUARE_LIMIT:
+        return min_distance * min_distance
+    bound = math.ceil(min_distance * min_distance)
+    while bound > 0 and math.sqrt(bound - 1) >= min_distance:
+        bound -= 1
+    while math.sqrt(bound) < min_distance:
+        bound += 1
+    return bound
+
+
+def _squared_distance_check(operator: str, bound: float) -> str:
+    """Build an inline squared-distance comparison for generated validators.
+
+    Args:
+        operator: Comparison operator, ``"<="`` or ``">="``
+        bound: Threshold from ``_max_squared_distance`` or
+            ``_min_squared_distance``
+
+    Returns:
+        Source of a boolean expression on ``p1`` and ``p2``
+    """
+    if math.isnan(bound):
+        return "False"
+    if math.isinf(bound):
+        # Every squared distance is on the same side of an infinite bound
+        return "True" if (bound > 0) == (operator == "<=") else "False"
+    return f"(p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2 {operator} {bound!r}"
+
+
 class MaxDistanceConstraint(ConnectionConstraint):
     """Constraint that limits the maximum distance between connected points.
 
@@ -17,6 +132,8 @@ class MaxDistanceConstraint(ConnectionConstraint):
     that might visually clutter the grid or violate design requirements.
     """
 
+    __slots__ = ("_max_distance", "_max_sq")
+
     def __init__(self, max_distance: float = 2.0, enabled: bool = False) -> None:
         """Initialize the maximum distance constraint.
 
@@ -27,6 +144,17 @@ class MaxDistanceConstraint(ConnectionConstraint):
         super().__init__("Max Distance", enabled)
         self.max_distance = max_distance
 
+    @property
+    def max_distance(self) -> float:
+        """Maximum allowed distance between connected points."""
+        return self._max_distance
+
+    @max_distance.setter
+    def max_distance(self, max_distance: float) -> None:
+        self._max_distance = max_distance
+        self._max_sq = _max_squared_distance(max_distance)
+        self._parameters_changed()
+
     def validate(self, grid: "Grid", point1: "Point", point2: "Point") -> bool:
         """Validate that connection distance is within limit.
 
@@ -41,8 +169,39 @@ class MaxDistanceConstraint(ConnectionConstraint):
         if not self.enabled:
             return True
 
-        distance = self._calculate_distance(point1, point2)
-        return distance <= self.max_distance
+        return _within_max_sq(point1.x, point1.y, point2.x, point2.y, self._max_sq)
+
+    def validate_batch(
+        self, grid: "Grid", point: "Point", candidates: List["Point"]
+    ) -> List[bool]:
+        """Validate the distance from one point to each of several candidates.
+
+        Args:
+            grid: The grid containing the points
+            point: Point every proposed connection starts from
+            candidates: Other end of each proposed connection
+
+        Returns:
+            One flag per candidate, True where the distance is within the maximum limit
+        """
+        if not self.enabled:
+            return [True] * len(candidates)
+
+        x = point.x
+        y = point.y
+        limit = self._max_sq
+        return [
+            (c.x - x) * (c.x - x) + (c.y - y) * (c.y - y) <= limit for c in candidates
+        ]
+
+    def get_inline_check(self) -> str:
+        """Get the maximum distance check as an expression on ``p1`` and ``p2``.
+
+        Returns:
+            Source of the squared-distance comparison with the threshold
+            baked in
+        """
+        return _squared_distance_check("<=", self._max_sq)
 
     def get_description(self) -> str:
         """Get description of this constraint.
@@ -68,20 +227,6 @@ class MaxDistanceConstraint(ConnectionConstraint):
         """
         return self.max_distance
 
-    def _calculate_distance(self, point1: "Point", point2: "Point") -> float:
-        """Calculate Euclidean distance between two points.
-
-        Args:
-            point1: First point
-            point2: Second point
-
-        Returns:
-            Euclidean distance between the points
-        """
-        dx = point2.x - point1.x
-        dy = point2.y - point1.y
-        return math.sqrt(dx * dx + dy * dy)
-
     def __repr__(self) -> str:
         """String representation for debugging."""
         status = "enabled" if self.enabled else "disabled"
@@ -95,6 +240,8 @@ class MinDistanceConstraint(ConnectionConstraint):
     be visually distinct or meaningful.
     """
 
+    __slots__ = ("_min_distance", "_min_sq")
+
     def __init__(self, min_distance: float = 1.0, enabled: bool = False) -> None:
         """Initialize the minimum distance constraint.
 
@@ -105,6 +252,17 @@ class MinDistanceConstraint(ConnectionConstraint):
         super().__init__("Min Distance", enabled)
         self.min_distance = min_distance
 
+    @property
+    def min_distance(self) -> float:
+        """Minimum required distance between connected points."""
+        return self._min_distance
+
+    @min_distance.setter
+    def min_distance(self, min_distance: float) -> None:
+        self._min_distance = min_distance
+        self._min_sq = _min_squared_distance(min_distance)
+        self._parameters_changed()
+
     def validate(self, grid: "Grid", point1: "Point", point2: "Point") -> bool:
         """Validate that connection distance meets minimum requirement.
 
@@ -119,8 +277,40 @@ class MinDistanceConstraint(ConnectionConstraint):
         if not self.enabled:
             return True
 
-        distance = self._calculate_distance(point1, point2)
-        return distance >= self.min_distance
+        return _within_min_sq(point1.x, point1.y, point2.x, point2.y, self._min_sq)
+
+    def validate_batch(
+        self, grid: "Grid", point: "Point", candidates: List["Point"]
+    ) -> List[bool]:
+        """Validate the distance from one point to each of several candidates.
+
+        Args:
+            grid: The grid containing the points
+            point: Point every proposed connection starts from
+            candidates: Other end of each proposed connection
+
+        Returns:
+            One flag per candidate, True where the distance meets the minimum
+            requirement
+        """
+        if not self.enabled:
+            return [True] * len(candidates)
+
+        x = point.x
+        y = point.y
+        limit = self._min_sq
+        return [
+            (c.x - x) * (c.x - x) + (c.y - y) * (c.y - y) >= limit for c in candidates
+        ]
+
+    def get_inline_check(self) -> str:
+        """Get the minimum distance check as an expression on ``p1`` and ``p2``.
+
+        Returns:
+            Source of the squared-distance comparison with the threshold
+            baked in
+        """
+        return _squared_distance_check(">=", self._min_sq)
 
     def get_description(self) -> str:
         """Get description of this constraint.
@@ -146,20 +336,6 @@ class MinDistanceConstraint(ConnectionConstraint):
         """
         return self.min_distance
 
-    def _calculate_distance(self, point1: "Point", point2: "Point") -> float:
-        """Calculate Euclidean distance between two points.
-
-        Args:
-            point1: First point
-            point2: Second point
-
-        Returns:
-            Euclidean distance between the points
-        """
-        dx = point2.x - point1.x
-        dy = point2.y - point1.y
-        return math.sqrt(dx * dx + dy * dy)
-
     def __repr__(self) -> str:
         """String representation for debugging."""
         status = "enabled" if self.enabled else "disabled"
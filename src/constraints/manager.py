@@ -1,6 +1,6 @@
 """Constraint manager for handling multiple connection constraints."""
 
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, List, cast
 
 from src.constraints.base import ConnectionConstraint, ValidationResult
 
@@ -9,6 +9,43 @@ if TYPE_CHECKING:
     from src.models.point import Point
 
 
+def _compile_validator(
+    constraints: List[ConnectionConstraint],
+) -> Callable[["Grid", "Point", "Point"], bool]:
+    """Generate one function that checks a connection against every constraint.
+
+    Each constraint contributes its inline check when it has one and a call
+    to its bound ``validate`` method otherwise, in the given order. As in
+    ConstraintManager.validate_connection_fast, the first failing check or
+    any exception makes the function return False.
+
+    Args:
+        constraints: Enabled constraints, in validation order
+
+    Returns:
+        Function taking ``(grid, point1, point2)`` and returning a bool
+    """
+    namespace: Dict[str, object] = {}
+    checks = []
+    for index, constraint in enumerate(constraints):
+        check = constraint.get_inline_check()
+        if check is None:
+            name = f"_validate_{index}"
+            namespace[name] = constraint.validate
+            check = f"{name}(grid, p1, p2)"
+        checks.append(f"        if not ({check}):\n            return False\n")
+
+    if checks:
+        body = "    try:\n" + "".join(checks)
+        body += "    except Exception:\n        return False\n"
+    else:
+        body = ""
+    source = "def _validate(grid, p1, p2):\n" + body + "    return True\n"
+
+    exec(compile(source, "<constraints>", "exec"), namespace)
+    return cast(Callable[["Grid", "Point", "Point"], bool], namespace["_validate"])
+
+
 class ConstraintManager:
     """Manages multiple connection constraints for the grid system.
 
@@ -21,6 +58,10 @@ class ConstraintManager:
         """Initialize the constraint manager."""
         self._constraints: Dict[str, ConnectionConstraint] = {}
         self._constraint_order: List[str] = []
+        # Enabled constraints in order, rebuilt whenever the set changes
+        self._enabled: List[ConnectionConstraint] = []
+        # Generated check of all enabled constraints, see _compile_validator
+        self._validate_fn = _compile_validator(self._enabled)
 
     def add_constraint(self, constraint: ConnectionConstraint) -> None:
         """Add a constraint to the manager.
@@ -36,6 +77,8 @@ class ConstraintManager:
 
         self._constraints[constraint.name] = constraint
         self._constraint_order.append(constraint.name)
+        constraint._manager = self
+        self._rebuild_enabled()
 
     def remove_constraint(self, name: str) -> bool:
         """Remove a constraint by name.
@@ -49,8 +92,9 @@ class ConstraintManager:
         if name not in self._constraints:
             return False
 
-        del self._constraints[name]
+        self._constraints.pop(name)._manager = None
         self._constraint_order.remove(name)
+        self._rebuild_enabled()
         return True
 
     def get_constraint(self, name: str) -> ConnectionConstraint:
@@ -125,12 +169,9 @@ class ConstraintManager:
             ValidationResult indicating if connection is valid.
             If any constraint fails, returns the first failure.
         """
-        # Check each constraint in order
-        for constraint_name in self._constraint_order:
-            constraint = self._constraints[constraint_name]
-
-            if not constraint.is_enabled():
-                continue
+        # Check each enabled constraint in order
+        for constraint in self._enabled:
+            constraint_name = constraint.name
 
             try:
                 is_valid = constraint.validate(grid, point1, point2)
@@ -156,6 +197,12 @@ class ConstraintManager:
     ) -> bool:
         """Fast validation that returns boolean result only.
 
+        Unlike validate_connection, no ValidationResult or failure reason is
+        built, which keeps this cheap enough for the chain builder's inner loop.
+        A constraint that raises is treated as a failed validation. The checks
+        run in a function generated whenever the enabled constraints or their
+        parameters change, with simple constraints inlined into it.
+
         Args:
             grid: The grid containing the points
             point1: First point of the proposed connection
@@ -164,8 +211,53 @@ class ConstraintManager:
         Returns:
             True if connection is valid, False otherwise
         """
-        result = self.validate_connection(grid, point1, point2)
-        return result.is_valid
+        return self._validate_fn(grid, point1, point2)
+
+    def validate_connection_batch(
+        self, grid: "Grid", point: "Point", candidates: List["Point"]
+    ) -> List[bool]:
+        """Validate connections from one point to several candidates at once.
+
+        Equivalent to calling validate_connection_fast for each candidate, but
+        each enabled constraint is asked once for the whole batch through its
+        ``validate_batch``. Candidates that fail a constraint are not passed
+        to the ones after it.
+
+        Args:
+            grid: The grid containing the points
+            point: Point every proposed connection starts from
+            candidates: Other end of each proposed connection
+
+        Returns:
+            One flag per candidate, True where the connection is valid
+        """
+        results = [True] * len(candidates)
+        pending = list(range(len(candidates)))
+
+        for constraint in self._enabled:
+            if not pending:
+                break
+            batch = [candidates[i] for i in pending]
+            try:
+                flags = constraint.validate_batch(grid, point, batch)
+            except Exception:
+                # Fall back to single checks so only the failing candidate fails
+                flags = []
+                for candidate in batch:
+                    try:
+                        flags.append(constraint.validate(grid, point, candidate))
+                    except Exception:
+                        flags.append(False)
+
+            still_pending = []
+            for i, flag in zip(pending, flags):
+                if flag:
+                    still_pending.append(i)
+                else:
+                    results[i] = False
+            pending = still_pending
+
+        return results
 
     def get_enabled_constraints(self) -> List[ConnectionConstraint]:
         """Get all currently enabled constraints.
@@ -173,11 +265,7 @@ class ConstraintManager:
         Returns:
             List of enabled constraints in order
         """
-        return [
-            self._constraints[name]
-            for name in self._constraint_order
-            if self._constraints[name].is_enabled()
-        ]
+        return self._enabled.copy()
 
     def get_all_constraints(self) -> List[ConnectionConstraint]:
         """Get all constraints (enabled and disabled).
@@ -197,8 +285,11 @@ class ConstraintManager:
 
     def clear_constraints(self) -> None:
         """Remove all constraints."""
+        for constraint in self._constraints.values():
+            constraint._manager = None
         self._constraints.clear()
         self._constraint_order.clear()
+        self._rebuild_enabled()
 
     def get_constraint_count(self) -> int:
         """Get total number of constraints.
@@ -214,9 +305,29 @@ class ConstraintManager:
         Returns:
             Number of enabled constraints
         """
-        return sum(
-            1 for constraint in self._constraints.values() if constraint.is_enabled()
-        )
+        return len(self._enabled)
+
+    def _rebuild_enabled(self) -> None:
+        """Refresh the cached list of enabled constraints.
+
+        Called when constraints are added or removed and, through the
+        constraint's ``enabled`` setter, whenever one is enabled or disabled.
+        """
+        self._enabled = [
+            self._constraints[name]
+            for name in self._constraint_order
+            if self._constraints[name].is_enabled()
+        ]
+        self._compile_validator()
+
+    def _compile_validator(self) -> None:
+        """Regenerate the function behind validate_connection_fast.
+
+        Called after the enabled constraints change and, through
+        ``ConnectionConstraint._parameters_changed``, when a constraint's
+        inline check does.
+        """
+        self._validate_fn = _compile_validator(self._enabled)
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -1,12 +1,80 @@
 """Non-crossing constraint implementation for connection validation."""
 
-from typing import TYPE_CHECKING, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
+from src.constraints._noncross_kernel import segments_intersect
 from src.constraints.base import ConnectionConstraint
+from src.models.point import Point
 
 if TYPE_CHECKING:
     from src.models.grid import Grid
-    from src.models.point import Point
+
+# Connections are keyed by the Point.key of both endpoints, normalized so the
+# smaller comes first, with the first shifted above the second; Point only
+# accepts coordinates whose key fits in 32 bits, so the two never overlap
+_CONNECTION_KEY_SHIFT = 32
+
+# Side length, in grid units, of the square cells used to index connections
+_CELL_SIZE = 4
+
+# A tracked connection's endpoint keys, endpoint coordinates and bounding box:
+# (key1, key2, x1, y1, x2, y2, min_x, min_y, max_x, max_y)
+_Record = Tuple[int, int, int, int, int, int, int, int, int, int]
+
+# Unit-step connections that conflict with a new unit step, keyed by the new
+# step's direction (p2 - p1 after normalization) and given as normalized
+# connections relative to its p1. Two distinct unit steps can only meet at a
+# shared grid point, which is allowed, or where the two diagonals of the
+# same square cross.
+_UNIT_CONFLICTS: Dict[
+    Tuple[int, int], Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...]
+] = {
+    (0, 1): (),
+    (1, 0): (),
+    (1, 1): (((0, 1), (1, 0)),),
+    (1, -1): (((0, -1), (1, 0)),),
+}
+
+
+def _pack_key(key1: int, key2: int) -> int:
+    """Combine the endpoint keys of a normalized connection into one integer.
+
+    Args:
+        key1: Point.key of the first endpoint
+        key2: Point.key of the second endpoint
+
+    Returns:
+        Key of the connection
+    """
+    return key1 << _CONNECTION_KEY_SHIFT | key2
+
+
+def _key_offset(dx: int, dy: int) -> int:
+    """Get the change in Point.key when a point moves by (dx, dy).
+
+    Point.key is linear in the coordinates, so the change is the same for
+    every point.
+
+    Args:
+        dx: Change of the x coordinate
+        dy: Change of the y coordinate
+
+    Returns:
+        Difference between the moved and the original key
+    """
+    return Point.pack_coordinates(dx, dy) - Point.pack_coordinates(0, 0)
+
+
+# The same conflicts in key form: each direction becomes the difference of the
+# step's endpoint keys, and each conflicting step an offset from the key of
+# the zero-length connection at the new step's first endpoint
+_UNIT_CONFLICT_DELTAS: Dict[int, Tuple[int, ...]] = {
+    _key_offset(dx, dy): tuple(
+        (_key_offset(ax, ay) << _CONNECTION_KEY_SHIFT) + _key_offset(bx, by)
+        for (ax, ay), (bx, by) in conflicts
+    )
+    for (dx, dy), conflicts in _UNIT_CONFLICTS.items()
+}
 
 
 class NonCrossingConstraint(ConnectionConstraint):
@@ -17,6 +85,8 @@ class NonCrossingConstraint(ConnectionConstraint):
     different chains in the grid.
     """
 
+    __slots__ = ("_active_connections", "_cells", "_irregular", "_irregular_extent")
+
     def __init__(self, enabled: bool = True) -> None:
         """Initialize the non-crossing constraint.
 
@@ -24,7 +94,19 @@ class NonCrossingConstraint(ConnectionConstraint):
             enabled: Whether this constraint is initially enabled
         """
         super().__init__("Non-Crossing", enabled)
-        self._active_connections: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
+        # Packed keys (see _pack_key) of the tracked connections mapped to their
+        # record, built once when the connection is added so validation never
+        # recomputes bounding boxes
+        self._active_connections: Dict[int, _Record] = {}
+        # Spatial index: each cell maps the keys of the connections whose
+        # bounding box touches it to their records, so validation only looks
+        # at nearby ones
+        self._cells: Dict[Tuple[int, int], Dict[int, _Record]] = {}
+        # Tracked connections that are not unit steps between neighboring
+        # points, keyed the same way; the grid only creates unit steps
+        self._irregular: Dict[int, _Record] = {}
+        # Union of the irregular connections' bounding boxes, None when empty
+        self._irregular_extent: Optional[Tuple[int, int, int, int]] = None
 
     def validate(self, grid: "Grid", point1: "Point", point2: "Point") -> bool:
         """Validate that a connection doesn't cross existing connections.
@@ -40,17 +122,26 @@ class NonCrossingConstraint(ConnectionConstraint):
         if not self.enabled:
             return True
 
-        # Convert points to coordinate tuples for comparison
-        new_connection = self._normalize_connection(
-            (point1.x, point1.y), (point2.x, point2.y)
-        )
-
-        # Check against all existing connections
-        for existing_connection in self._active_connections:
-            if self._connections_intersect(new_connection, existing_connection):
-                return False
-
-        return True
+        new_record = self._make_record(point1, point2)
+
+        # A unit step can only conflict with a known handful of other unit
+        # steps, so look those up directly and test just the irregular rest
+        deltas = self._unit_step_conflicts(new_record)
+        if deltas is not None:
+            origin = _pack_key(new_record[0], new_record[0])
+            active_connections = self._active_connections
+            for delta in deltas:
+                if origin + delta in active_connections:
+                    return False
+            # Skip the irregular connections when none can be near the step
+            extent = self._irregular_extent
+            if extent is None or not self._bbox_overlaps_cached(new_record[6:], extent):
+                return True
+            return not self._intersects_any(new_record, self._irregular.values())
+
+        # Only connections sharing a cell can have overlapping bounding boxes
+        nearby = self._nearby_records(new_record[6:])
+        return not self._intersects_any(new_record, nearby.values())
 
     def add_connection(self, point1: "Point", point2: "Point") -> None:
         """Register a new connection in the tracking system.
@@ -59,10 +150,18 @@ class NonCrossingConstraint(ConnectionConstraint):
             point1: First point of the connection
             point2: Second point of the connection
         """
-        connection = self._normalize_connection(
-            (point1.x, point1.y), (point2.x, point2.y)
-        )
-        self._active_connections.add(connection)
+        record = self._make_record(point1, point2)
+        key = _pack_key(record[0], record[1])
+        if key in self._active_connections:
+            return
+
+        bbox = record[6:]
+        self._active_connections[key] = record
+        for cell in self._bbox_cells(bbox):
+            self._cells.setdefault(cell, {})[key] = record
+        if self._unit_step_conflicts(record) is None:
+            self._irregular[key] = record
+            self._irregular_extent = self._union_bbox(self._irregular_extent, bbox)
 
     def remove_connection(self, point1: "Point", point2: "Point") -> bool:
         """Remove a connection from the tracking system.
@@ -74,17 +173,29 @@ class NonCrossingConstraint(ConnectionConstraint):
         Returns:
             True if connection was found and removed
         """
-        connection = self._normalize_connection(
-            (point1.x, point1.y), (point2.x, point2.y)
-        )
-        if connection in self._active_connections:
-            self._active_connections.remove(connection)
+        key = _pack_key(*self._normalize_connection(point1.key, point2.key))
+        if key in self._active_connections:
+            record = self._active_connections.pop(key)
+            for cell in self._bbox_cells(record[6:]):
+                records = self._cells[cell]
+                del records[key]
+                if not records:
+                    del self._cells[cell]
+            if self._irregular.pop(key, None) is not None:
+                # The extent may shrink, so rebuild it from the remaining ones
+                extent = None
+                for other in self._irregular.values():
+                    extent = self._union_bbox(extent, other[6:])
+                self._irregular_extent = extent
             return True
         return False
 
     def clear_connections(self) -> None:
         """Clear all tracked connections."""
         self._active_connections.clear()
+        self._cells.clear()
+        self._irregular.clear()
+        self._irregular_extent = None
 
     def get_connection_count(self) -> int:
         """Get the number of tracked connections.
@@ -102,145 +213,165 @@ class NonCrossingConstraint(ConnectionConstraint):
         """
         return "prevents chains from crossing each other geometrically"
 
-    def _normalize_connection(
-        self, p1: Tuple[int, int], p2: Tuple[int, int]
-    ) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    def _normalize_connection(self, key1: int, key2: int) -> Tuple[int, int]:
         """Normalize connection so that comparison is order-independent.
 
         Args:
-            p1: First point coordinates
-            p2: Second point coordinates
+            key1: Point.key of the first point
+            key2: Point.key of the second point
 
         Returns:
-            Normalized connection tuple with smaller point first
+            Both keys, smaller first
         """
-        if p1 <= p2:
-            return (p1, p2)
+        if key1 <= key2:
+            return (key1, key2)
         else:
-            return (p2, p1)
+            return (key2, key1)
 
-    def _connections_intersect(
-        self,
-        conn1: Tuple[Tuple[int, int], Tuple[int, int]],
-        conn2: Tuple[Tuple[int, int], Tuple[int, int]],
-    ) -> bool:
-        """Check if two connections intersect.
+    def _make_record(self, point1: "Point", point2: "Point") -> _Record:
+        """Build the record of a connection, with its endpoints normalized.
 
         Args:
-            conn1: First connection as ((x1,y1), (x2,y2))
-            conn2: Second connection as ((x3,y3), (x4,y4))
+            point1: First point of the connection
+            point2: Second point of the connection
 
         Returns:
-            True if the connections intersect
+            Record of the connection, see ``_Record``
         """
-        p1, p2 = conn1
-        p3, p4 = conn2
+        key1 = point1.key
+        key2 = point2.key
+        if key2 < key1:
+            point1, point2 = point2, point1
+            key1, key2 = key2, key1
+        x1 = point1.x
+        y1 = point1.y
+        x2 = point2.x
+        y2 = point2.y
+        # Ordered keys are ordered by x, but not necessarily by y
+        if y1 <= y2:
+            return (key1, key2, x1, y1, x2, y2, x1, y1, x2, y2)
+        return (key1, key2, x1, y1, x2, y2, x1, y2, x2, y1)
+
+    def _unit_step_conflicts(self, record: _Record) -> Optional[Tuple[int, ...]]:
+        """Get the key deltas of the unit steps that conflict with a connection.
 
-        # Skip if connections share endpoints
-        if p1 == p3 or p1 == p4 or p2 == p3 or p2 == p4:
-            return False
+        Args:
+            record: Record of the connection
+
+        Returns:
+            Deltas from ``_UNIT_CONFLICT_DELTAS``, or None if the connection is
+            not a horizontal, vertical or diagonal unit step
+        """
+        deltas = _UNIT_CONFLICT_DELTAS.get(record[1] - record[0])
+        # A long connection's keys can differ by as much as a unit step's when
+        # its y coordinates span the whole 16-bit range
+        if deltas is None or not -1 <= record[5] - record[3] <= 1:
+            return None
+        return deltas
+
+    def _union_bbox(
+        self,
+        extent: Optional[Tuple[int, int, int, int]],
+        bbox: Tuple[int, int, int, int],
+    ) -> Tuple[int, int, int, int]:
+        """Grow an aggregate bounding box to cover another box.
 
-        # Quick bounding box check for early elimination
-        if not self._bounding_boxes_overlap(p1, p2, p3, p4):
-            return False
+        Args:
+            extent: Aggregate box as (min_x, min_y, max_x, max_y), or None
+                for an empty one
+            bbox: Box to include, in the same form
 
-        # Full geometric intersection test
-        return self._segments_intersect(p1, p2, p3, p4)
+        Returns:
+            Smallest box containing both
+        """
+        if extent is None:
+            return bbox
+        return (
+            min(extent[0], bbox[0]),
+            min(extent[1], bbox[1]),
+            max(extent[2], bbox[2]),
+            max(extent[3], bbox[3]),
+        )
 
-    def _bounding_boxes_overlap(
-        self,
-        p1: Tuple[int, int],
-        p2: Tuple[int, int],
-        p3: Tuple[int, int],
-        p4: Tuple[int, int],
-    ) -> bool:
-        """Check if bounding boxes of two line segments overlap.
+    def _bbox_cells(self, bbox: Tuple[int, int, int, int]) -> List[Tuple[int, int]]:
+        """Get the index cells touched by a bounding box.
 
         Args:
-            p1, p2: Endpoints of first segment
-            p3, p4: Endpoints of second segment
+            bbox: Bounding box as (min_x, min_y, max_x, max_y)
 
         Returns:
-            True if bounding boxes overlap
+            List of (cell_x, cell_y) keys into the spatial index
         """
-        min_x1, max_x1 = min(p1[0], p2[0]), max(p1[0], p2[0])
-        min_y1, max_y1 = min(p1[1], p2[1]), max(p1[1], p2[1])
-        min_x2, max_x2 = min(p3[0], p4[0]), max(p3[0], p4[0])
-        min_y2, max_y2 = min(p3[1], p4[1]), max(p3[1], p4[1])
+        min_x, min_y, max_x, max_y = bbox
+        cell_xs = range(min_x // _CELL_SIZE, max_x // _CELL_SIZE + 1)
+        cell_ys = range(min_y // _CELL_SIZE, max_y // _CELL_SIZE + 1)
+        return [(cell_x, cell_y) for cell_x in cell_xs for cell_y in cell_ys]
 
-        return not (
-            max_x1 < min_x2 or max_x2 < min_x1 or max_y1 < min_y2 or max_y2 < min_y1
-        )
+    def _nearby_records(self, bbox: Tuple[int, int, int, int]) -> Dict[int, _Record]:
+        """Get the records of connections sharing an index cell with a bounding box.
 
-    def _segments_intersect(
-        self,
-        p1: Tuple[int, int],
-        p2: Tuple[int, int],
-        p3: Tuple[int, int],
-        p4: Tuple[int, int],
-    ) -> bool:
-        """Check if two line segments intersect using parametric equations.
+        Every connection whose bounding box overlaps the given one is
+        included; the result may also contain connections that are further
+        away.
 
         Args:
-            p1, p2: Endpoints of first segment
-            p3, p4: Endpoints of second segment
+            bbox: Bounding box as (min_x, min_y, max_x, max_y)
 
         Returns:
-            True if segments intersect
+            Candidate records to test for intersection, by connection key
         """
-        x1, y1 = p1
-        x2, y2 = p2
-        x3, y3 = p3
-        x4, y4 = p4
+        nearby: Dict[int, _Record] = {}
+        for cell in self._bbox_cells(bbox):
+            records = self._cells.get(cell)
+            if records:
+                nearby.update(records)
+        return nearby
 
-        # Direction vectors
-        dx1, dy1 = x2 - x1, y2 - y1
-        dx2, dy2 = x4 - x3, y4 - y3
+    def _intersects_any(self, record: _Record, records: Iterable[_Record]) -> bool:
+        """Check a connection against a group of tracked connections.
 
-        # Calculate determinant
-        det = dx1 * dy2 - dy1 * dx2
+        Each record carries everything needed to reject it with plain
+        integer comparisons; the full intersection test only runs on
+        survivors.
 
-        # Lines are parallel (or coincident)
-        if abs(det) < 1e-10:
-            # Check if segments are collinear and overlapping
-            return self._collinear_segments_intersect(p1, p2, p3, p4)
+        Args:
+            record: Record of the connection to check
+            records: Records of the connections to test against
 
-        # Calculate parametric intersection parameters
-        dx3, dy3 = x1 - x3, y1 - y3
-        t1 = (dx2 * dy3 - dy2 * dx3) / det
-        t2 = (dx1 * dy3 - dy1 * dx3) / det
+        Returns:
+            True if the connection intersects any of the connections
+        """
+        key1, key2, x1, y1, x2, y2, min_x1, min_y1, max_x1, max_y1 = record
+        for other in records:
+            key3, key4, x3, y3, x4, y4, min_x2, min_y2, max_x2, max_y2 = other
+            if max_x1 < min_x2 or max_x2 < min_x1 or max_y1 < min_y2 or max_y2 < min_y1:
+                continue
+            # Connections that share an endpoint are allowed to meet there
+            if key1 == key3 or key1 == key4 or key2 == key3 or key2 == key4:
+                continue
+            if segments_intersect(x1, y1, x2, y2, x3, y3, x4, y4):
+                return True
 
-        # Check if intersection point is within both segments
-        return 0 <= t1 <= 1 and 0 <= t2 <= 1
+        return False
 
-    def _collinear_segments_intersect(
-        self,
-        p1: Tuple[int, int],
-        p2: Tuple[int, int],
-        p3: Tuple[int, int],
-        p4: Tuple[int, int],
+    def _bbox_overlaps_cached(
+        self, bbox1: Tuple[int, int, int, int], bbox2: Tuple[int, int, int, int]
     ) -> bool:
-        """Check if two collinear segments overlap.
+        """Check if two precomputed bounding boxes overlap.
 
         Args:
-            p1, p2: Endpoints of first segment
-            p3, p4: Endpoints of second segment
+            bbox1: First box as (min_x, min_y, max_x, max_y)
+            bbox2: Second box as (min_x, min_y, max_x, max_y)
 
         Returns:
-            True if collinear segments overlap
+            True if bounding boxes overlap
         """
-        # Use the coordinate with larger range for projection
-        if abs(p2[0] - p1[0]) >= abs(p2[1] - p1[1]):
-            # Project onto x-axis
-            min1, max1 = min(p1[0], p2[0]), max(p1[0], p2[0])
-            min2, max2 = min(p3[0], p4[0]), max(p3[0], p4[0])
-        else:
-            # Project onto y-axis
-            min1, max1 = min(p1[1], p2[1]), max(p1[1], p2[1])
-            min2, max2 = min(p3[1], p4[1]), max(p3[1], p4[1])
-
-        # Check for overlap
-        return max1 >= min2 and max2 >= min1
+        return not (
+            bbox1[2] < bbox2[0]
+            or bbox2[2] < bbox1[0]
+            or bbox1[3] < bbox2[1]
+            or bbox2[3] < bbox1[1]
+        )
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -1,9 +1,9 @@
 """Grid canvas for visualizing the grid and chains."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPainter, QPen
+from PyQt6.QtCore import QLine, QPoint, QRect, Qt
+from PyQt6.QtGui import QPainter, QPen, QPixmap, QPolygon
 from PyQt6.QtWidgets import QWidget
 
 from src.models.chain import Chain
@@ -34,6 +34,29 @@ class GridCanvas(QWidget):
         # Data
         self.grid: Optional[Grid] = None
         self.chains: List[Chain] = []
+        # Chain still being built during an animation, drawn after self.chains
+        self.active_chain: Optional[Chain] = None
+
+        # Canvas coordinates of every grid point, indexed [x][y], and the
+        # (width, height, rows, cols) they were computed for
+        self._coord_cache: List[List[Tuple[int, int]]] = []
+        self._layout_key: Optional[Tuple[int, int, int, int]] = None
+        # Grid line segments for the current layout
+        self._grid_lines: List[QLine] = []
+        # Pre-rendered background and grid lines, rebuilt with the layout
+        self._static_pixmap: Optional[QPixmap] = None
+        # Canvas bounding box (left, top, right, bottom) of each drawn chain,
+        # with the number of points it was computed for
+        self._chain_extents: Dict[Chain, Tuple[int, Tuple[int, int, int, int]]] = {}
+
+        # Pens are built once and reused by every paint; the point pens depend
+        # on the point radius and are rebuilt with the layout
+        self.point_radius = self.base_point_radius
+        self._grid_pen = QPen(self.grid_color, 1, Qt.PenStyle.DotLine)
+        self._chain_pen = QPen(self.chain_color, self.line_width)
+        self._connected_pen = QPen()
+        self._unconnected_pen = QPen()
+        self._build_point_pens()
 
     def update_grid(self, grid: Grid) -> None:
         """Update the grid to be displayed.
@@ -43,20 +66,64 @@ class GridCanvas(QWidget):
         """
         self.grid = grid
         self.chains = []
+        self.active_chain = None
+        self._static_pixmap = None
+        self._chain_extents.clear()
         self.update()
 
     def update_chains(self, chains: List[Chain]) -> None:
         """Update the chains to be displayed.
 
+        The list is kept by reference, so chains appended to it later are
+        drawn on the next repaint without calling this again.
+
         Args:
             chains: List of chains to display
         """
         self.chains = chains
+        self._chain_extents.clear()
         self.update()
 
+    def set_active_chain(self, chain: Optional[Chain]) -> None:
+        """Set the chain that is still being built.
+
+        Does not repaint; use append_chain_segment to refresh the area that
+        changed.
+
+        Args:
+            chain: Chain under construction, or None
+        """
+        self.active_chain = chain
+
+    def append_chain_segment(self, point1: Point, point2: Point) -> None:
+        """Repaint only the area around a newly added chain segment.
+
+        Pass the same point twice to refresh a single point, for example one
+        that just started a chain.
+
+        Args:
+            point1: First point of the new segment
+            point2: Second point of the new segment
+        """
+        if not self.grid:
+            return
+
+        self._calculate_layout()
+        x1, y1 = self._point_to_canvas_coords(point1)
+        x2, y2 = self._point_to_canvas_coords(point2)
+        # Cover the chain line as well as the points' circles
+        pad = max(self.line_width, self.point_radius + 2)
+        left = min(x1, x2) - pad
+        top = min(y1, y2) - pad
+        self.update(
+            QRect(left, top, abs(x2 - x1) + 2 * pad + 1, abs(y2 - y1) + 2 * pad + 1)
+        )
+
     def clear_chains(self) -> None:
         """Clear all chain visualizations."""
         self.chains = []
+        self.active_chain = None
+        self._chain_extents.clear()
         self.update()
 
     def paintEvent(self, event) -> None:
@@ -68,29 +135,39 @@ class GridCanvas(QWidget):
         if not self.grid:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Clear background
-        painter.fillRect(self.rect(), self.background_color)
-
         # Calculate grid layout
         self._calculate_layout()
 
-        # Draw grid lines (optional, subtle)
-        self._draw_grid_lines(painter)
+        # Background and grid lines only change with the layout
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._static_pixmap)
 
         # Draw chains first (so they appear behind points)
-        self._draw_chains(painter)
+        self._draw_chains(painter, event.rect())
 
         # Draw points
         self._draw_points(painter)
 
     def _calculate_layout(self) -> None:
-        """Calculate the layout parameters for drawing the grid."""
+        """Calculate the layout parameters for drawing the grid.
+
+        The layout only depends on the widget size and grid dimensions, so
+        it is recomputed only when one of those has changed.
+        """
         if not self.grid:
             return
 
+        layout_key = (self.width(), self.height(), self.grid.rows, self.grid.cols)
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+        self._static_pixmap = None
+        self._chain_extents.clear()
+
         # Available drawing area
         available_width = self.width() - 2 * self.margin
         available_height = self.height() - 2 * self.margin
@@ -112,6 +189,52 @@ class GridCanvas(QWidget):
 
         # Calculate dynamic point radius based on grid density
         self.point_radius = self._calculate_point_radius()
+        self._build_point_pens()
+
+        # Canvas position of every point; grid x is the row, grid y the column
+        canvas_xs = [
+            int(self.start_x + col * self.point_spacing_x)
+            for col in range(self.grid.cols)
+        ]
+        canvas_ys = [
+            int(self.start_y + row * self.point_spacing_y)
+            for row in range(self.grid.rows)
+        ]
+        self._coord_cache = [
+            [(canvas_x, canvas_y) for canvas_x in canvas_xs] for canvas_y in canvas_ys
+        ]
+
+        # One vertical line per column and one horizontal line per row
+        left, right = canvas_xs[0], canvas_xs[-1]
+        top, bottom = canvas_ys[0], canvas_ys[-1]
+        self._grid_lines = [QLine(x, top, x, bottom) for x in canvas_xs]
+        self._grid_lines += [QLine(left, y, right, y) for y in canvas_ys]
+
+    def _build_point_pens(self) -> None:
+        """Build the round-capped pens that draw points at the current radius."""
+        diameter = 2 * self.point_radius + 2
+        self._connected_pen = QPen(self.connected_point_color, diameter)
+        self._connected_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._unconnected_pen = QPen(self.unconnected_point_color, diameter)
+        self._unconnected_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+
+    def _render_static(self) -> QPixmap:
+        """Render the parts of the canvas that only change with the layout.
+
+        Returns:
+            Pixmap of the widget's size holding the background and grid lines
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.background_color)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Draw grid lines (optional, subtle)
+        self._draw_grid_lines(painter)
+        painter.end()
+        return pixmap
 
     def _calculate_point_radius(self) -> int:
         """Calculate the appropriate point radius based on grid dimensions.
@@ -141,100 +264,138 @@ class GridCanvas(QWidget):
         Args:
             painter: The painter to draw with
         """
-        if not self.grid:
+        if not self.grid or not self._grid_lines:
             return
 
-        pen = QPen(self.grid_color, 1, Qt.PenStyle.DotLine)
-        painter.setPen(pen)
-
-        # Draw vertical lines
-        for col in range(self.grid.cols):
-            x = int(self.start_x + col * self.point_spacing_x)
-            painter.drawLine(
-                x,
-                int(self.start_y),
-                x,
-                int(self.start_y + (self.grid.rows - 1) * self.point_spacing_y),
-            )
-
-        # Draw horizontal lines
-        for row in range(self.grid.rows):
-            y = int(self.start_y + row * self.point_spacing_y)
-            painter.drawLine(
-                int(self.start_x),
-                y,
-                int(self.start_x + (self.grid.cols - 1) * self.point_spacing_x),
-                y,
-            )
+        painter.setPen(self._grid_pen)
+        # Passed one by one, the form of drawLines the PyQt6 stubs accept
+        painter.drawLines(*self._grid_lines)
 
     def _draw_points(self, painter: QPainter) -> None:
         """Draw all points in the grid.
 
+        Points are grouped by color and each group is drawn with a single
+        drawPoints call. A round-capped pen as wide as the point draws each
+        one as a filled circle.
+
         Args:
             painter: The painter to draw with
         """
         if not self.grid:
             return
 
+        connected = QPolygon()
+        unconnected = QPolygon()
         for point in self.grid.get_all_points():
-            self._draw_point(painter, point)
+            x, y = self._point_to_canvas_coords(point)
+            if point.connected:
+                connected.append(QPoint(x, y))
+            else:
+                unconnected.append(QPoint(x, y))
+
+        for pen, points in (
+            (self._unconnected_pen, unconnected),
+            (self._connected_pen, connected),
+        ):
+            if points.isEmpty():
+                continue
+            painter.setPen(pen)
+            painter.drawPoints(points)
+
+    def _draw_chains(self, painter: QPainter, clip: QRect) -> None:
+        """Draw all chains.
 
-    def _draw_point(self, painter: QPainter, point: Point) -> None:
-        """Draw a single point.
+        Every chain segment that can touch the repainted area is collected
+        first and drawn with one drawLines call.
 
         Args:
             painter: The painter to draw with
-            point: The point to draw
+            clip: Area being repainted
         """
-        x, y = self._point_to_canvas_coords(point)
-
-        # Choose color based on connection status
-        if point.connected:
-            color = self.connected_point_color
-        else:
-            color = self.unconnected_point_color
-
-        # Draw point as filled circle
-        painter.setPen(QPen(color, 2))
-        painter.setBrush(color)
-        painter.drawEllipse(
-            x - self.point_radius,
-            y - self.point_radius,
-            2 * self.point_radius,
-            2 * self.point_radius,
+        chains = self.chains
+        if self.active_chain is not None:
+            chains = chains + [self.active_chain]
+
+        # Grow the clip by the pen width so segments just outside still count
+        pad = self.line_width
+        bounds = (
+            clip.left() - pad,
+            clip.top() - pad,
+            clip.right() + pad,
+            clip.bottom() + pad,
         )
+        left, top, right, bottom = bounds
+        lines: List[QLine] = []
+        for chain in chains:
+            extent = self._chain_extent(chain)
+            # Whole chains away from the repainted area are skipped unconverted
+            if (
+                extent is None
+                or extent[2] < left
+                or extent[0] > right
+                or extent[3] < top
+                or extent[1] > bottom
+            ):
+                continue
+            lines.extend(self._chain_lines(chain, bounds))
+        if not lines:
+            return
 
-    def _draw_chains(self, painter: QPainter) -> None:
-        """Draw all chains.
-
-        Args:
-            painter: The painter to draw with
-        """
-        pen = QPen(self.chain_color, self.line_width)
-        painter.setPen(pen)
+        painter.setPen(self._chain_pen)
+        painter.drawLines(*lines)
 
-        for chain in self.chains:
-            self._draw_chain(painter, chain)
+    def _chain_extent(self, chain: Chain) -> Optional[Tuple[int, int, int, int]]:
+        """Get the canvas bounding box of a chain.
 
-    def _draw_chain(self, painter: QPainter, chain: Chain) -> None:
-        """Draw a single chain.
+        The box is cached per chain and only recomputed after the chain's
+        points or the layout change.
 
         Args:
-            painter: The painter to draw with
-            chain: The chain to draw
-        """
-        if len(chain.points) < 2:
-            return
+            chain: The chain to measure
 
-        # Draw lines between consecutive points in the chain
-        for i in range(len(chain.points) - 1):
-            point1 = chain.points[i]
-            point2 = chain.points[i + 1]
+        Returns:
+            Bounding box as (left, top, right, bottom), or None for an empty
+            chain
+        """
+        points = chain.points
+        cached = self._chain_extents.get(chain)
+        if cached is not None and cached[0] == len(points):
+            return cached[1]
+        if not points:
+            return None
+
+        coords = [self._point_to_canvas_coords(point) for point in points]
+        xs = [x for x, _ in coords]
+        ys = [y for _, y in coords]
+        extent = (min(xs), min(ys), max(xs), max(ys))
+        self._chain_extents[chain] = (len(points), extent)
+        return extent
+
+    def _chain_lines(
+        self, chain: Chain, bounds: Tuple[int, int, int, int]
+    ) -> List[QLine]:
+        """Get the canvas line segments of a single chain within some bounds.
 
-            x1, y1 = self._point_to_canvas_coords(point1)
-            x2, y2 = self._point_to_canvas_coords(point2)
+        Args:
+            chain: The chain to convert
+            bounds: Area of interest as (left, top, right, bottom)
 
-            painter.drawLine(x1, y1, x2, y2)
+        Returns:
+            One line between each pair of consecutive points in the chain,
+            skipping lines whose bounding box lies outside the bounds
+        """
+        left, top, right, bottom = bounds
+        coords = [self._point_to_canvas_coords(point) for point in chain.points]
+        return [
+            QLine(x1, y1, x2, y2)
+            for (x1, y1), (x2, y2) in zip(coords, coords[1:])
+            if not (
+                max(x1, x2) < left
+                or min(x1, x2) > right
+                or max(y1, y2) < top
+                or min(y1, y2) > bottom
+            )
+        ]
 
     def _point_to_canvas_coords(self, point: Point) -> tuple[int, int]:
         """Convert grid point coordinates to canvas pixel coordinates.
@@ -243,11 +404,9 @@ class GridCanvas(QWidget):
             point: The point to convert
 
         Returns:
-            Tuple of (x, y) canvas coordinates
+            Tuple of (x, y) canvas coordinates, as cached by _calculate_layout
         """
-        canvas_x = int(self.start_x + point.y * self.point_spacing_x)
-        canvas_y = int(self.start_y + point.x * self.point_spacing_y)
-        return canvas_x, canvas_y
+        return self._coord_cache[point.x][point.y]
 
     def sizeHint(self):
         """Provide size hint for the widget."""
@@ -1,6 +1,6 @@
 """Main window for the Grid Connection Game."""
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QElapsedTimer, Qt, QTimer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -14,9 +14,16 @@ from PyQt6.QtWidgets import (
 )
 
 from src.algorithms.chain_builder import ChainBuilder
+from src.constraints.manager import ConstraintManager
 from src.gui.grid_canvas import GridCanvas
 from src.models.grid import Grid
 
+# Animation ticks between statistics updates while a build is animated
+_STATISTICS_INTERVAL = 5
+# Longest time, in ms, one animation tick keeps building before it hands
+# control back to the event loop
+_TICK_BUDGET_MS = 16
+
 
 class MainWindow(QMainWindow):
     """Main application window for the Grid Connection Game."""
@@ -29,9 +36,24 @@ class MainWindow(QMainWindow):
 
         # Initialize game components
         self.grid = Grid(5, 5)
+        # Looked up once per grid rather than on every constraint toggle
+        self._constraint_manager: ConstraintManager | None = getattr(
+            self.grid, "constraint_manager", None
+        )
         self.chain_builder: ChainBuilder | None = None
+        # Each animation tick runs the build steps that are due and then
+        # re-arms this single-shot timer for the next one
         self.animation_timer = QTimer()
+        self.animation_timer.setSingleShot(True)
         self.animation_timer.timeout.connect(self._animate_step)
+        self._animating = False
+        # Animation ticks since the build started, used to throttle statistics
+        self._animation_ticks = 0
+        # Time between build steps in ms, set by the speed slider; steps are
+        # paced against a clock restarted whenever the speed changes
+        self._step_interval = 0
+        self._pacing_clock = QElapsedTimer()
+        self._paced_steps = 0
 
         # Setup UI
         self._setup_ui()
@@ -155,6 +177,7 @@ class MainWindow(QMainWindow):
         cols = self.cols_spinbox.value()
 
         self.grid = Grid(rows, cols)
+        self._constraint_manager = getattr(self.grid, "constraint_manager", None)
         self.canvas.update_grid(self.grid)
         self._update_status("Grid resized")
         self._update_statistics()
@@ -166,27 +189,29 @@ class MainWindow(QMainWindow):
     def _on_speed_changed(self) -> None:
         """Handle animation speed changes."""
         speed = self.speed_slider.value()
-        # Convert slider value (1-10) to timer interval (100-1000ms)
-        interval = 1100 - (speed * 100)
-        self.animation_timer.setInterval(interval)
+        # Convert slider value (1-10) to step interval (100-1000ms)
+        self._step_interval = 1100 - (speed * 100)
+        self._pacing_clock.start()
+        self._paced_steps = 0
 
     def _on_constraint_changed(self) -> None:
         """Handle constraint checkbox changes."""
         non_crossing_enabled = self.non_crossing_checkbox.isChecked()
 
         # Update the constraint in the grid
-        if hasattr(self.grid, "constraint_manager"):
+        constraint_manager = self._constraint_manager
+        if constraint_manager is not None:
             if non_crossing_enabled:
-                self.grid.constraint_manager.enable_constraint("Non-Crossing")
+                constraint_manager.enable_constraint("Non-Crossing")
                 self._update_status("Non-crossing constraint enabled")
             else:
-                self.grid.constraint_manager.disable_constraint("Non-Crossing")
+                constraint_manager.disable_constraint("Non-Crossing")
                 self._update_status("Non-crossing constraint disabled")
 
     def _on_connect_clicked(self) -> None:
         """Handle connect button click to start chain building."""
-        if self.animation_timer.isActive():
-            self.animation_timer.stop()
+        if self._animating:
+            self._stop_animation()
             self._update_status("Animation stopped")
             return
 
@@ -199,9 +224,15 @@ class MainWindow(QMainWindow):
             if total_points > 400:  # 20x20 threshold
                 # Start animated building for large grids
                 self.chain_builder.start_animated_build()
+                self._animation_ticks = 0
+                # The canvas keeps this list and sees chains as they complete
+                self.canvas.update_chains(self.chain_builder.chains)
                 self._update_status("Building chains...")
                 self.connect_button.setText("Stop Animation")
-                self.animation_timer.start()
+                self._animating = True
+                self._pacing_clock.start()
+                self._paced_steps = 0
+                self.animation_timer.start(0)
             else:
                 # Build immediately for small grids
                 chains = self.chain_builder.build_chains()
@@ -214,41 +245,86 @@ class MainWindow(QMainWindow):
 
     def _on_reset_clicked(self) -> None:
         """Handle reset button click to clear all connections."""
-        self.animation_timer.stop()
+        self._stop_animation()
         self.grid.reset_connections()
         self.canvas.clear_chains()
         self.connect_button.setText("Connect Points")
         self._update_status("Grid reset")
         self._update_statistics()
 
+    def _stop_animation(self) -> None:
+        """Stop an animated build and cancel its next tick."""
+        self._animating = False
+        self.animation_timer.stop()
+
     def _animate_step(self) -> None:
-        """Perform one step of the animation."""
-        if not self.chain_builder:
-            self.animation_timer.stop()
+        """Perform one tick of the animation.
+
+        Runs every build step that is due at the current speed, all of them
+        when there is no step interval, until the tick's time budget is used
+        up. The canvas regions changed by those steps are repainted together
+        once control returns to the event loop.
+        """
+        if not self.chain_builder or not self._animating:
+            self._stop_animation()
             return
 
-        # Perform one step of chain building
-        has_more_steps = self.chain_builder.build_step()
-        
-        # Update the canvas with current chains
-        all_chains = self.chain_builder.chains.copy()
-        if self.chain_builder.current_chain and self.chain_builder.current_chain.length > 0:
-            all_chains.append(self.chain_builder.current_chain)
-        
-        self.canvas.update_chains(all_chains)
-        self._update_statistics()
-        
+        tick_clock = QElapsedTimer()
+        tick_clock.start()
+        while True:
+            has_more_steps = self._build_step()
+            self._paced_steps += 1
+            if not has_more_steps or tick_clock.elapsed() >= _TICK_BUDGET_MS:
+                break
+            if self._pacing_clock.elapsed() < self._paced_steps * self._step_interval:
+                break  # The next step is not due yet
+
         # Check if animation is complete
         if not has_more_steps or self.chain_builder.is_animation_complete():
-            self.animation_timer.stop()
+            self._stop_animation()
+            self.canvas.update_chains(self.chain_builder.chains)
             self.connect_button.setText("Connect Points")
             self._update_status("All points connected!")
+            self._update_statistics()
         else:
+            # Statistics only need refreshing every few steps
+            self._animation_ticks += 1
+            if self._animation_ticks % _STATISTICS_INTERVAL == 0:
+                self._update_statistics()
+
             # Show progress
-            connected_count = len(self.grid.get_connected_points())
+            connected_count = self.grid.connected_count
             total_count = self.grid.total_points
             self._update_status(f"Building chains... {connected_count}/{total_count} points connected")
 
+            # Come back when the next step is due
+            delay = self._paced_steps * self._step_interval
+            self.animation_timer.start(max(0, delay - self._pacing_clock.elapsed()))
+
+    def _build_step(self) -> bool:
+        """Perform one step of chain building and mark what it changed.
+
+        Returns:
+            True if there are more steps to perform
+        """
+        chain_builder = self.chain_builder
+        if chain_builder is None:
+            return False
+        has_more_steps = chain_builder.build_step()
+
+        # Completed chains are already in the canvas's shared list; only the
+        # chain under construction and the area it just changed need updating
+        current_chain = chain_builder.current_chain
+        self.canvas.set_active_chain(current_chain)
+        if current_chain is not None and current_chain.points:
+            # The step either started this chain or added a point at one of
+            # its ends; points are in path order, so refresh both end segments
+            points = current_chain.points
+            last = len(points) - 1
+            self.canvas.append_chain_segment(points[0], points[min(1, last)])
+            self.canvas.append_chain_segment(points[max(0, last - 1)], points[last])
+        return has_more_steps
+
     def _update_status(self, message: str) -> None:
         """Update the status label.
 
@@ -260,26 +336,26 @@ class MainWindow(QMainWindow):
     def _update_statistics(self) -> None:
         """Update the statistics display."""
         total_points = self.grid.total_points
-        connected_points = len(self.grid.get_connected_points())
+        connected_points = self.grid.connected_count
         chain_builder = getattr(self, "chain_builder", None)
-        chain_count = len(chain_builder.chains if chain_builder else [])
-
-        stats_text = f"{connected_points}/{total_points} points connected\n"
-        stats_text += f"{chain_count} chains"
+        chains = chain_builder.chains if chain_builder else []
 
+        coverage_text = ""
         if connected_points > 0:
             coverage = (connected_points / total_points) * 100
-            stats_text += f"\n{coverage:.1f}% coverage"
+            coverage_text = f"\n{coverage:.1f}% coverage"
 
         # Add chain length statistics
-        if chain_builder and chain_builder.chains:
-            total_connections = sum(
-                chain.connection_count for chain in chain_builder.chains
+        length_text = ""
+        if chains:
+            total_connections = sum(chain.connection_count for chain in chains)
+            avg_length = total_connections / len(chains)
+            length_text = (
+                f"\n{total_connections} total connections"
+                f"\nAvg chain length: {avg_length:.1f}"
             )
-            avg_length = sum(
-                chain.connection_count for chain in chain_builder.chains
-            ) / len(chain_builder.chains)
-            stats_text += f"\n{total_connections} total connections"
-            stats_text += f"\nAvg chain length: {avg_length:.1f}"
 
-        self.stats_label.setText(stats_text)
+        self.stats_label.setText(
+            f"{connected_points}/{total_points} points connected\n"
+            f"{len(chains)} chains{coverage_text}{length_text}"
+        )
@@ -0,0 +1,42 @@
+"""Numeric kernels for grid point geometry.
+
+These functions take plain integer coordinates and run as ordinary Python:
+they are called once per point pair, where numba's per-call dispatch would
+cost more than the arithmetic it compiles.
+"""
+
+
+def is_adjacent(x1: int, y1: int, x2: int, y2: int) -> bool:
+    """Check if two positions are distinct 8-directional neighbors.
+
+    Args:
+        x1: Row coordinate of the first position
+        y1: Column coordinate of the first position
+        x2: Row coordinate of the second position
+        y2: Column coordinate of the second position
+
+    Returns:
+        True if the positions differ by at most one in each coordinate
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    # Chained comparisons instead of abs(); in CPython this is also faster
+    # than combining the three tests with bitwise operators
+    return -1 <= dx <= 1 and -1 <= dy <= 1 and (dx != 0 or dy != 0)
+
+
+def manhattan_distance(x1: int, y1: int, x2: int, y2: int) -> int:
+    """Get the Manhattan distance between two positions.
+
+    Args:
+        x1: Row coordinate of the first position
+        y1: Column coordinate of the first position
+        x2: Row coordinate of the second position
+        y2: Column coordinate of the second position
+
+    Returns:
+        Sum of the absolute coordinate differences
+    """
+    dx = x1 - x2 if x1 > x2 else x2 - x1
+    dy = y1 - y2 if y1 > y2 else y2 - y1
+    return dx + dy
@@ -1,12 +1,17 @@
 """Chain class representing a connected sequence of points."""
 
-from typing import List
+from typing import List, Optional, Set, Tuple
 
 from src.models.point import Point
 
 
 class Chain:
-    """Represents a linear chain of connected points."""
+    """Represents a linear chain of connected points.
+
+    ``points`` lists the chain's points in path order. Treat it as read-only:
+    only add_point and remove_point may change it, since they also keep the
+    chain's endpoint tracking in sync.
+    """
 
     def __init__(self, chain_id: int, max_connection_count: int) -> None:
         """Initialize a chain with the given constraints.
@@ -24,7 +29,15 @@ class Chain:
 
         self.chain_id = chain_id
         self.max_connection_count = max_connection_count
+        # Points in path order; see the class docstring
         self.points: List[Point] = []
+        # Same points as self.points, for constant-time membership checks
+        self._point_set: Set[Point] = set()
+        # First and last point of the path, and the endpoints built from
+        # them; updated whenever a point is added or removed
+        self._head: Optional[Point] = None
+        self._tail: Optional[Point] = None
+        self._endpoints: Tuple[Point, ...] = ()
 
     def can_add_point(self, point: Point) -> bool:
         """Check if a point can be added to this chain.
@@ -35,6 +48,24 @@ class Chain:
         Returns:
             True if point can be added, False otherwise
         """
+        if not self._has_room_for(point):
+            return False
+
+        if not self.points:
+            return True  # First point in chain
+
+        # Check if we can connect to an endpoint of the chain
+        return self._find_connectable_endpoint(point) is not None
+
+    def _has_room_for(self, point: Point) -> bool:
+        """Check the conditions for adding a point that don't involve endpoints.
+
+        Args:
+            point: The point to potentially add
+
+        Returns:
+            True if the point is free and the chain is not full
+        """
         if point.connected:
             return False
 
@@ -43,29 +74,22 @@ class Chain:
             return False
 
         # Check if point can accept a connection (max 2 per point)
-        if not point.can_accept_connection():
-            return False
-
-        if not self.points:
-            return True  # First point in chain
-
-        # Check if we can connect to an endpoint of the chain
-        return self._can_connect_to_endpoint(point)
+        return point.can_accept_connection()
 
-    def _can_connect_to_endpoint(self, point: Point) -> bool:
-        """Check if point can connect to an endpoint of this chain.
+    def _find_connectable_endpoint(self, point: Point) -> Optional[Point]:
+        """Find an endpoint of this chain that the point can connect to.
 
         Args:
             point: The point to potentially connect
 
         Returns:
-            True if point can connect to a chain endpoint
+            The first open endpoint adjacent to the point, or None
         """
-        endpoints = self.get_endpoints()
-        for endpoint in endpoints:
-            if endpoint.can_accept_connection() and point.is_adjacent_to(endpoint):
-                return True
-        return False
+        is_adjacent_to = point.is_adjacent_to
+        for endpoint in self._endpoints:
+            if endpoint.can_accept_connection() and is_adjacent_to(endpoint):
+                return endpoint
+        return None
 
     def add_point(self, point: Point) -> bool:
         """Add a point to this chain.
@@ -79,33 +103,22 @@ class Chain:
         Raises:
             ValueError: If the point cannot be added to this chain
         """
-        if not self.can_add_point(point):
+        if not self._has_room_for(point):
             raise ValueError(f"Cannot add point {point} to chain {self.chain_id}")
 
         if not self.points:
             # First point in chain
-            point.connected = True
-            point.chain_id = self.chain_id
-            self.points.append(point)
+            self._add_point_unchecked(point)
             return True
 
-        # Find which endpoint to connect to
-        endpoints = self.get_endpoints()
-        connected = False
-
-        for endpoint in endpoints:
-            if endpoint.can_accept_connection() and point.is_adjacent_to(endpoint):
-                # Create the direct connection
-                endpoint.add_direct_connection(point)
-                point.connected = True
-                point.chain_id = self.chain_id
-                self.points.append(point)
-                connected = True
-                break
-
-        if not connected:
-            raise ValueError(f"Could not connect point {point} to any endpoint")
+        # Find which endpoint to connect to, as can_add_point would
+        endpoint = self._find_connectable_endpoint(point)
+        if endpoint is None:
+            raise ValueError(f"Cannot add point {point} to chain {self.chain_id}")
 
+        # Create the direct connection
+        endpoint.add_direct_connection(point)
+        self._add_point_unchecked(point, endpoint)
         return True
 
     def remove_point(self, point: Point) -> bool:
@@ -117,28 +130,71 @@ class Chain:
         Returns:
             True if point was successfully removed
         """
-        if point not in self.points:
+        if point not in self._point_set:
             return False
 
         # Reset the point's state
         point.reset_connections()
         self.points.remove(point)
+        self._point_set.discard(point)
+        self._head = self.points[0] if self.points else None
+        self._tail = self.points[-1] if self.points else None
+        self._update_endpoints()
         return True
 
-    def get_endpoints(self) -> List[Point]:
+    def _add_point_unchecked(
+        self, point: Point, endpoint: Optional[Point] = None
+    ) -> None:
+        """Add a point next to one of the chain's endpoints without any checks.
+
+        Only the chain and the point's chain state are updated; callers that
+        have already picked a valid endpoint, such as add_point and the chain
+        builder, create the connection to it themselves. The points list
+        stays in path order: a point attached to the head is inserted before
+        it, any other point is appended after the tail.
+
+        Args:
+            point: The point to add, already connected to the chain
+            endpoint: Endpoint the point is connected to; omitted for the
+                first point of a chain
+        """
+        point.connected = True
+        point.chain_id = self.chain_id
+        if not self.points:
+            self.points.append(point)
+            self._head = self._tail = point
+        elif endpoint == self._head and endpoint != self._tail:
+            self.points.insert(0, point)
+            self._head = point
+        else:
+            self.points.append(point)
+            self._tail = point
+        self._point_set.add(point)
+        self._update_endpoints()
+
+    def _update_endpoints(self) -> None:
+        """Rebuild the endpoints returned by get_endpoints from head and tail."""
+        head = self._head
+        tail = self._tail
+        # Head and tail are set and cleared together
+        if head is None or tail is None:
+            self._endpoints = ()
+        elif head is tail:
+            self._endpoints = (head,)
+        else:
+            self._endpoints = (head, tail)
+
+    def get_endpoints(self) -> Tuple[Point, ...]:
         """Get the endpoint(s) of the chain.
 
         For a linear chain, this returns the first and last points.
-        For a single point, returns that point.
+        For a single point, returns that point. The endpoints are tracked as
+        points are added, so nothing is recomputed here.
 
         Returns:
-            List of endpoint points
+            Tuple of endpoint points
         """
-        if not self.points:
-            return []
-        if len(self.points) == 1:
-            return [self.points[0]]
-        return [self.points[0], self.points[-1]]
+        return self._endpoints
 
     def is_valid_chain(self) -> bool:
         """Validate that this chain forms a valid linear path.
@@ -146,43 +202,33 @@ class Chain:
         Returns:
             True if chain is valid, False otherwise
         """
-        if not self.points:
+        points = self.points
+        point_count = len(points)
+        if not point_count:
             return True
 
-        if self.connection_count > self.max_connection_count:
+        if point_count - 1 > self.max_connection_count:
             return False
 
         # Check that the chain forms a valid linear path using direct connections
-        if len(self.points) == 1:
+        if point_count == 1:
             # Single point is valid
             return True
 
-        # For multiple points, verify they form a linear path
-        # Count endpoints (1 connection) and middle points (2 connections)
+        # For multiple points, verify they form a linear path in one pass:
+        # every point needs 1 (endpoint) or 2 (middle point) connections and
+        # the chain's id, and there must be exactly 2 endpoints, which leaves
+        # len(points) - 2 middle points
+        chain_id = self.chain_id
         endpoints = 0
-        middle_points = 0
-
-        for point in self.points:
-            if point.is_endpoint():
-                endpoints += 1
-            elif point.is_middle_point():
-                middle_points += 1
-            else:
-                # Point has 0 connections or invalid connection count
-                return False
-
-        # Valid linear chain should have exactly 2 endpoints
-        # and (len(points) - 2) middle points
-        expected_middle_points = len(self.points) - 2
-        if not (endpoints == 2 and middle_points == expected_middle_points):
-            return False
-
-        # Check that all points have correct chain_id
-        for point in self.points:
-            if point.chain_id != self.chain_id or not point.connected:
+        for point in points:
+            count = point.get_connection_count()
+            if count == 0 or point.chain_id != chain_id or not point.connected:
                 return False
+            if count == 1:
+                endpoints += 1
 
-        return True
+        return endpoints == 2
 
     @property
     def point_count(self) -> int:
@@ -210,7 +256,20 @@ class Chain:
         return len(self.points) == 0
 
     def __repr__(self) -> str:
-        """String representation for debugging."""
+        """Short string representation that does not list the points."""
+        return (
+            f"Chain(id={self.chain_id}, "
+            f"connections={self.connection_count}/{self.max_connection_count}, "
+            f"points={self.point_count})"
+        )
+
+    def debug_repr(self) -> str:
+        """Get a string representation including the full path.
+
+        Returns:
+            The chain summary followed by the coordinates of every point in
+            path order
+        """
         points_repr = [f"({p.x},{p.y})" for p in self.points]
         return (
             f"Chain(id={self.chain_id}, "
@@ -1,10 +1,19 @@
 """Grid class representing the N×M grid of points."""
 
-from typing import List, Optional
+from itertools import compress
+from typing import List, Optional, Tuple
 
 from src.constraints.manager import ConstraintManager
 from src.constraints.non_crossing import NonCrossingConstraint
-from src.models.point import Point
+from src.models.point import MAX_COORDINATE, Point
+
+# Offsets of the 8 neighboring positions, in row-major order
+_NEIGHBOR_OFFSETS = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx != 0 or dy != 0
+)
+
+# bytes.translate table that swaps the 0 and 1 entries of a connection mask
+_INVERT_MASK = bytes([1, 0]) + bytes(254)
 
 
 class Grid:
@@ -18,17 +27,42 @@ class Grid:
             cols: Number of columns in the grid
 
         Raises:
-            ValueError: If rows or cols are less than 1
+            ValueError: If rows or cols are less than 1, or so large that
+                point coordinates would exceed MAX_COORDINATE
         """
         if rows < 1 or cols < 1:
             raise ValueError("Grid dimensions must be at least 1x1")
+        max_size = MAX_COORDINATE + 1
+        if rows > max_size or cols > max_size:
+            raise ValueError(f"Grid dimensions must be at most {max_size}x{max_size}")
 
         self.rows = rows
         self.cols = cols
-        self.points = [[Point(i, j) for j in range(cols)] for i in range(rows)]
+        # All points in row-major order, so the point at (x, y) has index
+        # x * cols + y, and one byte per point in the same order that is 1
+        # while the point is connected
+        self._all_points: Tuple[Point, ...] = tuple(
+            Point(i, j) for i in range(rows) for j in range(cols)
+        )
+        for point in self._all_points:
+            point._grid = self
+        # Rows of the same points, indexed [x][y]
+        self.points = [
+            list(self._all_points[i * cols : (i + 1) * cols]) for i in range(rows)
+        ]
+        self._connected_mask = bytearray(rows * cols)
+        # Number of points whose connected flag is set; like the mask, kept
+        # current by _connected_changed
+        self._connected_count = 0
+        # The layout never changes, so neighbors are found once, indexed [x][y]
+        self._neighbors = [
+            [self._find_neighbors(i, j) for j in range(cols)] for i in range(rows)
+        ]
 
         # Initialize constraint system
         self.constraint_manager = ConstraintManager()
+        # Default non-crossing constraint, notified of every connection change
+        self._non_crossing: Optional[NonCrossingConstraint] = None
         self._setup_default_constraints()
 
     def get_point(self, x: int, y: int) -> Optional[Point]:
@@ -57,44 +91,66 @@ class Grid:
         """
         return 0 <= x < self.rows and 0 <= y < self.cols
 
-    def get_neighbors(self, point: Point) -> List[Point]:
+    def get_neighbors(self, point: Point) -> Tuple[Point, ...]:
         """Get all valid neighboring points (8-directional adjacency).
 
         Args:
-            point: The point to find neighbors for
+            point: The point to find neighbors for; must lie within the grid
 
         Returns:
-            List of neighboring points
-        """
-        neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                neighbor_x = point.x + dx
-                neighbor_y = point.y + dy
-                if self.is_valid_position(neighbor_x, neighbor_y):
-                    neighbors.append(self.points[neighbor_x][neighbor_y])
-        return neighbors
-
-    def get_all_points(self) -> List[Point]:
-        """Get all points in the grid as a flat list.
+            Tuple of neighboring points, computed when the grid was created
+            and shared between calls, which is why it is immutable
+        """
+        return self._neighbors[point.x][point.y]
+
+    def _find_neighbors(self, x: int, y: int) -> Tuple[Point, ...]:
+        """Collect the in-bounds neighbors of a position.
+
+        Args:
+            x: Row coordinate
+            y: Column coordinate
 
         Returns:
-            List of all points in the grid
+            Tuple of neighboring points
         """
-        points = []
-        for row in self.points:
-            points.extend(row)
-        return points
+        return tuple(
+            self.points[x + dx][y + dy]
+            for dx, dy in _NEIGHBOR_OFFSETS
+            if self.is_valid_position(x + dx, y + dy)
+        )
+
+    def get_all_points(self) -> Tuple[Point, ...]:
+        """Get all points in the grid in row-major order.
+
+        Returns:
+            Tuple of all points in the grid, built when the grid was created
+            and shared between calls, which is why it is immutable
+        """
+        return self._all_points
 
     def get_unconnected_points(self) -> List[Point]:
         """Get all points that are not yet connected to any chain.
 
+        Every change to a point's ``connected`` flag is tracked as it
+        happens, so this does not look at the points themselves.
+
         Returns:
             List of unconnected points
         """
-        return [point for point in self.get_all_points() if not point.connected]
+        unconnected_mask = self._connected_mask.translate(_INVERT_MASK)
+        return list(compress(self._all_points, unconnected_mask))
+
+    def _connected_changed(self, point: Point, connected: bool) -> None:
+        """Update the connected-point tracking after a point's flag changed.
+
+        Called by the ``connected`` setter of this grid's points.
+
+        Args:
+            point: The point whose flag changed
+            connected: The new value of the flag
+        """
+        self._connected_mask[point.x * self.cols + point.y] = connected
+        self._connected_count += 1 if connected else -1
 
     def validate_connection(self, point1: Point, point2: Point) -> bool:
         """Validate if a connection between two points is allowed.
@@ -108,6 +164,21 @@ class Grid:
         """
         return self.constraint_manager.validate_connection_fast(self, point1, point2)
 
+    def validate_connections(self, point: Point, candidates: List[Point]) -> List[bool]:
+        """Validate connections from one point to each of several candidates.
+
+        Args:
+            point: Point every proposed connection starts from
+            candidates: Other end of each proposed connection
+
+        Returns:
+            One flag per candidate, True where the connection is valid
+            according to all enabled constraints
+        """
+        return self.constraint_manager.validate_connection_batch(
+            self, point, candidates
+        )
+
     def add_connection(self, point1: Point, point2: Point) -> bool:
         """Add a connection between two points with constraint validation.
 
@@ -153,6 +224,7 @@ class Grid:
         # Add non-crossing constraint (enabled by default)
         non_crossing = NonCrossingConstraint(enabled=True)
         self.constraint_manager.add_constraint(non_crossing)
+        self._non_crossing = non_crossing
 
     def _notify_connection_added(self, point1: Point, point2: Point) -> None:
         """Notify constraint system that a connection was added.
@@ -162,9 +234,8 @@ class Grid:
             point2: Second point of the connection
         """
         # Update non-crossing constraint tracking
-        for constraint in self.constraint_manager.get_all_constraints():
-            if isinstance(constraint, NonCrossingConstraint):
-                constraint.add_connection(point1, point2)
+        if self._non_crossing is not None:
+            self._non_crossing.add_connection(point1, point2)
 
     def _notify_connection_removed(self, point1: Point, point2: Point) -> None:
         """Notify constraint system that a connection was removed.
@@ -174,33 +245,41 @@ class Grid:
             point2: Second point of the connection
         """
         # Update non-crossing constraint tracking
-        for constraint in self.constraint_manager.get_all_constraints():
-            if isinstance(constraint, NonCrossingConstraint):
-                constraint.remove_connection(point1, point2)
+        if self._non_crossing is not None:
+            self._non_crossing.remove_connection(point1, point2)
 
     def reset_connections(self) -> None:
         """Reset all points to unconnected state."""
-        for point in self.get_all_points():
-            point.reset_connections()
+        # Every point is cleared, so connections need not be removed one by one
+        for point in self._all_points:
+            point._bulk_clear()
+        self._connected_mask = bytearray(self.total_points)
+        self._connected_count = 0
 
         # Clear constraint tracking
-        for constraint in self.constraint_manager.get_all_constraints():
-            if isinstance(constraint, NonCrossingConstraint):
-                constraint.clear_connections()
+        if self._non_crossing is not None:
+            self._non_crossing.clear_connections()
 
     def get_connected_points(self) -> List[Point]:
         """Get all points that are connected to a chain.
 
+        Like get_unconnected_points, this is answered from the tracked flags.
+
         Returns:
             List of connected points
         """
-        return [point for point in self.get_all_points() if point.connected]
+        return list(compress(self._all_points, self._connected_mask))
 
     @property
     def total_points(self) -> int:
         """Get the total number of points in the grid."""
         return self.rows * self.cols
 
+    @property
+    def connected_count(self) -> int:
+        """Get the number of points whose connected flag is set."""
+        return self._connected_count
+
     @property
     def connection_progress(self) -> float:
         """Get the percentage of points that are connected.
@@ -208,13 +287,12 @@ class Grid:
         Returns:
             Percentage (0.0 to 1.0) of connected points
         """
-        connected_count = len(self.get_connected_points())
-        return connected_count / self.total_points if self.total_points > 0 else 0.0
+        total_points = self.rows * self.cols
+        return self._connected_count / total_points if total_points > 0 else 0.0
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        connected_count = len(self.get_connected_points())
         return (
             f"Grid({self.rows}x{self.cols}, "
-            f"{connected_count}/{self.total_points} connected)"
+            f"{self._connected_count}/{self.total_points} connected)"
         )
@@ -1,40 +1,146 @@
 """Point class representing a single position in the grid."""
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+from src.models._numeric import is_adjacent, manhattan_distance
+
+if TYPE_CHECKING:
+    from src.models.grid import Grid
+
+# Point.key stores each coordinate in 16 bits, offset so that coordinates from
+# -32768 to 32767 fit
+_KEY_BITS = 16
+_KEY_OFFSET = 1 << (_KEY_BITS - 1)
+
+# Range of coordinates a Point accepts
+MIN_COORDINATE = -_KEY_OFFSET
+MAX_COORDINATE = _KEY_OFFSET - 1
 
 
 class Point:
     """Represents a single point in the grid with connection state."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "_connected",
+        "chain_id",
+        "_c0",
+        "_c1",
+        "_key",
+        "_hash",
+        "_grid",
+    )
+
     def __init__(self, x: int, y: int) -> None:
         """Initialize a point at the given coordinates.
 
         Args:
-            x: Row coordinate
-            y: Column coordinate
+            x: Row coordinate, from MIN_COORDINATE to MAX_COORDINATE
+            y: Column coordinate, from MIN_COORDINATE to MAX_COORDINATE
+
+        Raises:
+            ValueError: If a coordinate is out of range
         """
         self.x = x
         self.y = y
-        self.connected = False
+        # Grid this point belongs to, told whenever ``connected`` changes
+        self._grid: Optional["Grid"] = None
+        self._connected = False
         self.chain_id: Optional[int] = None
-        self.direct_connections: List["Point"] = []  # Max 2 direct connections
+        # The up to 2 direct connections; _c1 is only set while _c0 is
+        self._c0: Optional["Point"] = None
+        self._c1: Optional["Point"] = None
+        # Points never move, so the packed coordinates and the hash are
+        # computed once
+        self._key = self.pack_coordinates(x, y)
+        self._hash = hash((x, y))
+
+    @staticmethod
+    def pack_coordinates(x: int, y: int) -> int:
+        """Pack a pair of coordinates into one integer.
+
+        Packed values compare in the same order as ``(x, y)`` tuples and
+        fit in 32 bits.
+
+        Args:
+            x: Row coordinate, from MIN_COORDINATE to MAX_COORDINATE
+            y: Column coordinate, from MIN_COORDINATE to MAX_COORDINATE
+
+        Returns:
+            The packed coordinates
+
+        Raises:
+            ValueError: If a coordinate is out of range, as it would overlap
+                the other one's bits
+        """
+        if not (
+            MIN_COORDINATE <= x <= MAX_COORDINATE
+            and MIN_COORDINATE <= y <= MAX_COORDINATE
+        ):
+            raise ValueError(
+                f"Point coordinates must be between {MIN_COORDINATE} and "
+                f"{MAX_COORDINATE}, got ({x}, {y})"
+            )
+        return (x + _KEY_OFFSET) << _KEY_BITS | (y + _KEY_OFFSET)
+
+    @property
+    def connected(self) -> bool:
+        """Whether the point has joined a chain."""
+        return self._connected
+
+    @connected.setter
+    def connected(self, connected: bool) -> None:
+        if connected != self._connected:
+            self._connected = connected
+            # Keep the owning grid's connected-point tracking current
+            if self._grid is not None:
+                self._grid._connected_changed(self, connected)
+
+    @property
+    def direct_connections(self) -> List["Point"]:
+        """Get the points this point is directly connected to.
+
+        Returns a new list; use add_direct_connection and
+        remove_direct_connection to change the connections.
+        """
+        if self._c0 is None:
+            return []
+        if self._c1 is None:
+            return [self._c0]
+        return [self._c0, self._c1]
+
+    @property
+    def key(self) -> int:
+        """Get the point's coordinates packed by pack_coordinates."""
+        return self._key
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on coordinates."""
         if not isinstance(other, Point):
             return False
-        return self.x == other.x and self.y == other.y
+        # The packed key is unique per coordinate pair, so one compare suffices
+        return self._key == other._key
 
     def __hash__(self) -> int:
         """Hash based on coordinates for use in sets and dictionaries."""
-        return hash((self.x, self.y))
+        return self._hash
 
     def __repr__(self) -> str:
-        """String representation for debugging."""
+        """Short string representation, cheap enough for error messages."""
+        return f"Point({self.x}, {self.y})"
+
+    def debug_repr(self) -> str:
+        """Get a string representation including the connection state.
+
+        Returns:
+            The coordinates together with the connected flag, chain id and
+            number of connections
+        """
         return (
             f"Point({self.x}, {self.y}, "
             f"connected={self.connected}, chain_id={self.chain_id}, "
-            f"connections={len(self.direct_connections)})"
+            f"connections={self.get_connection_count()})"
         )
 
     def distance_to(self, other: "Point") -> int:
@@ -46,7 +152,7 @@ class Point:
         Returns:
             Manhattan distance as integer
         """
-        return abs(self.x - other.x) + abs(self.y - other.y)
+        return manhattan_distance(self.x, self.y, other.x, other.y)
 
     def is_adjacent_to(self, other: "Point") -> bool:
         """Check if this point is adjacent to another (8-directional).
@@ -57,9 +163,7 @@ class Point:
         Returns:
             True if points are adjacent, False otherwise
         """
-        dx = abs(self.x - other.x)
-        dy = abs(self.y - other.y)
-        return dx <= 1 and dy <= 1 and (dx + dy) > 0
+        return is_adjacent(self.x, self.y, other.x, other.y)
 
     def can_accept_connection(self) -> bool:
         """Check if this point can accept another direct connection.
@@ -69,7 +173,7 @@ class Point:
         Returns:
             True if point has less than 2 direct connections
         """
-        return len(self.direct_connections) < 2
+        return self._c1 is None
 
     def add_direct_connection(self, other: "Point") -> bool:
         """Add a direct connection to another point.
@@ -89,12 +193,13 @@ class Point:
             raise ValueError(f"Point {other} already has 2 connections")
         if not self.is_adjacent_to(other):
             raise ValueError(f"Points {self} and {other} are not adjacent")
-        if other in self.direct_connections:
+        # With a free slot, an existing connection can only be in the first
+        if other == self._c0:
             return False  # Already connected
 
         # Add bidirectional connection
-        self.direct_connections.append(other)
-        other.direct_connections.append(self)
+        self._attach(other)
+        other._attach(self)
         return True
 
     def remove_direct_connection(self, other: "Point") -> bool:
@@ -106,21 +211,47 @@ class Point:
         Returns:
             True if connection was removed successfully
         """
-        if other not in self.direct_connections:
+        if other != self._c0 and other != self._c1:
             return False
 
         # Remove bidirectional connection
-        self.direct_connections.remove(other)
-        other.direct_connections.remove(self)
+        self._detach(other)
+        other._detach(self)
         return True
 
+    def _attach(self, other: "Point") -> None:
+        """Store a connection in the first free slot of this point only.
+
+        Args:
+            other: The point to connect to; this point must have a free slot
+        """
+        if self._c0 is None:
+            self._c0 = other
+        else:
+            self._c1 = other
+
+    def _detach(self, other: "Point") -> None:
+        """Clear the slot holding a connection on this point only.
+
+        Args:
+            other: The point to disconnect from
+        """
+        if other == self._c0:
+            # Keep the remaining connection, if any, in the first slot
+            self._c0 = self._c1
+            self._c1 = None
+        elif other == self._c1:
+            self._c1 = None
+
     def get_connection_count(self) -> int:
         """Get the number of direct connections.
 
         Returns:
             Number of direct connections (0, 1, or 2)
         """
-        return len(self.direct_connections)
+        if self._c0 is None:
+            return 0
+        return 1 if self._c1 is None else 2
 
     def is_endpoint(self) -> bool:
         """Check if this point is a chain endpoint (exactly 1 connection).
@@ -128,7 +259,7 @@ class Point:
         Returns:
             True if point has exactly 1 connection
         """
-        return len(self.direct_connections) == 1
+        return self._c0 is not None and self._c1 is None
 
     def is_middle_point(self) -> bool:
         """Check if this point is in the middle of a chain (exactly 2 connections).
@@ -136,13 +267,24 @@ class Point:
         Returns:
             True if point has exactly 2 connections
         """
-        return len(self.direct_connections) == 2
+        return self._c1 is not None
 
     def reset_connections(self) -> None:
         """Reset all connection state."""
         # Remove all direct connections
-        for connected_point in self.direct_connections.copy():
+        for connected_point in self.direct_connections:
             self.remove_direct_connection(connected_point)
 
         self.connected = False
         self.chain_id = None
+
+    def _bulk_clear(self) -> None:
+        """Reset all connection state without updating the connected points.
+
+        Only safe when every point this one is connected to is cleared as
+        well, as Grid.reset_connections does for the whole grid. The grid is
+        not told about the change either; it resets its tracking in bulk.
+        """
+        self._c0 = self._c1 = None
+        self._connected = False
+        self.chain_id = None
@@ -0,0 +1,146 @@
+"""Tests for the generated validation function of ConstraintManager."""
+
+import itertools
+import math
+from typing import List
+
+import pytest
+
+from src.constraints.base import ConnectionConstraint
+from src.constraints.distance import MaxDistanceConstraint, MinDistanceConstraint
+from src.constraints.manager import ConstraintManager, _compile_validator
+from src.constraints.non_crossing import NonCrossingConstraint
+from src.models.grid import Grid
+from src.models.point import Point
+
+
+class SameRowConstraint(ConnectionConstraint):
+    """Constraint without an inline check: both points must share a row."""
+
+    def __init__(self) -> None:
+        super().__init__("Same Row")
+
+    def validate(self, grid: Grid, point1: Point, point2: Point) -> bool:
+        """Accept connections within one row."""
+        return point1.x == point2.x
+
+    def get_description(self) -> str:
+        """Describe the constraint."""
+        return "requires both points in the same row"
+
+
+class FailingConstraint(ConnectionConstraint):
+    """Constraint whose validation always raises."""
+
+    def __init__(self) -> None:
+        super().__init__("Failing")
+
+    def validate(self, grid: Grid, point1: Point, point2: Point) -> bool:
+        """Raise instead of validating."""
+        raise RuntimeError("validation failed")
+
+    def get_description(self) -> str:
+        """Describe the constraint."""
+        return "always raises"
+
+
+@pytest.fixture
+def grid() -> Grid:
+    """Provide a small grid with one tracked diagonal connection."""
+    grid = Grid(4, 4)
+    grid.add_connection(grid.get_point(1, 1), grid.get_point(2, 2))
+    return grid
+
+
+def _assert_fast_matches_full(manager: ConstraintManager, grid: Grid) -> None:
+    """Check the generated function against validate_connection on all pairs."""
+    points = grid.get_all_points()
+    for point1, point2 in itertools.permutations(points, 2):
+        expected = manager.validate_connection(grid, point1, point2).is_valid
+        assert manager.validate_connection_fast(grid, point1, point2) == expected
+
+
+def _distance_constraints() -> List[ConnectionConstraint]:
+    """Get distance constraints covering ordinary and special limits."""
+    return [
+        MaxDistanceConstraint(math.sqrt(2), enabled=True),
+        MaxDistanceConstraint(2.5, enabled=True),
+        MinDistanceConstraint(1.5, enabled=True),
+        MaxDistanceConstraint(math.inf, enabled=True),
+        MinDistanceConstraint(math.nan, enabled=True),
+    ]
+
+
+def test_empty_validator_accepts_everything(grid: Grid) -> None:
+    """With no constraints the generated function always returns True."""
+    validate = _compile_validator([])
+
+    assert validate(grid, grid.get_point(0, 0), grid.get_point(3, 3))
+
+
+def test_default_grid_constraints_match_full_validation(grid: Grid) -> None:
+    """The grid's own manager, with non-crossing enabled, agrees with itself."""
+    _assert_fast_matches_full(grid.constraint_manager, grid)
+
+
+@pytest.mark.parametrize(
+    "constraint", _distance_constraints(), ids=lambda constraint: repr(constraint)
+)
+def test_inline_distance_checks_match_full_validation(
+    grid: Grid, constraint: ConnectionConstraint
+) -> None:
+    """Each inlined distance check agrees with its validate method."""
+    manager = ConstraintManager()
+    manager.add_constraint(constraint)
+
+    _assert_fast_matches_full(manager, grid)
+
+
+def test_mixed_inline_and_called_checks_match_full_validation(grid: Grid) -> None:
+    """Inlined checks and validate calls combine in order."""
+    manager = ConstraintManager()
+    manager.add_constraint(NonCrossingConstraint())
+    manager.add_constraint(MaxDistanceConstraint(2.5, enabled=True))
+    manager.add_constraint(SameRowConstraint())
+    manager.add_constraint(MinDistanceConstraint(1.5, enabled=True))
+
+    _assert_fast_matches_full(manager, grid)
+
+
+def test_parameter_change_regenerates_validator(grid: Grid) -> None:
+    """Changing a constraint's limit is reflected without re-adding it."""
+    constraint = MaxDistanceConstraint(1.0, enabled=True)
+    manager = ConstraintManager()
+    manager.add_constraint(constraint)
+    point1, point2 = grid.get_point(0, 0), grid.get_point(0, 3)
+    assert not manager.validate_connection_fast(grid, point1, point2)
+
+    constraint.set_max_distance(3.0)
+
+    assert manager.validate_connection_fast(grid, point1, point2)
+    _assert_fast_matches_full(manager, grid)
+
+
+def test_enable_and_disable_regenerate_validator(grid: Grid) -> None:
+    """Toggling a constraint changes which checks the function runs."""
+    manager = ConstraintManager()
+    manager.add_constraint(SameRowConstraint())
+    point1, point2 = grid.get_point(0, 0), grid.get_point(3, 0)
+    assert not manager.validate_connection_fast(grid, point1, point2)
+
+    manager.disable_constraint("Same Row")
+    assert manager.validate_connection_fast(grid, point1, point2)
+
+    manager.enable_constraint("Same Row")
+    assert not manager.validate_connection_fast(grid, point1, point2)
+
+
+def test_raising_constraint_fails_validation(grid: Grid) -> None:
+    """A constraint that raises makes the connection invalid."""
+    manager = ConstraintManager()
+    manager.add_constraint(MaxDistanceConstraint(10.0, enabled=True))
+    manager.add_constraint(FailingConstraint())
+    point1, point2 = grid.get_point(0, 0), grid.get_point(0, 1)
+
+    assert not manager.validate_connection_fast(grid, point1, point2)
+    assert not manager.validate_connection(grid, point1, point2).is_valid
@@ -0,0 +1,83 @@
+"""Tests for the squared-distance bounds behind the distance constraints."""
+
+import math
+from typing import List
+
+import pytest
+
+from src.constraints.distance import (
+    _EXACT_SQUARE_LIMIT,
+    MaxDistanceConstraint,
+    MinDistanceConstraint,
+    _max_squared_distance,
+    _min_squared_distance,
+)
+from src.models.grid import Grid
+
+SPECIAL_LIMITS = [-math.inf, -1.0, 0.0, math.inf, math.nan]
+ORDINARY_LIMITS = [1e-9, 1.0, math.sqrt(2), 2.0, 2.5, math.sqrt(8), 1e6, 2**26]
+HUGE_LIMITS = [2**26 + 1.0, 1e12, 1e13, 1e200, 1e308]
+
+
+def _squared_distances(limit: float) -> List[int]:
+    """Get small squared distances plus those around the limit's square."""
+    squares = list(range(200))
+    if math.isfinite(limit) and limit > 0:
+        center = int(limit * limit)
+        squares += range(max(0, center - 50), center + 50)
+    return squares
+
+
+@pytest.mark.parametrize("limit", SPECIAL_LIMITS + ORDINARY_LIMITS)
+def test_max_bound_matches_sqrt_comparison(limit: float) -> None:
+    """``s <= bound`` holds exactly when ``sqrt(s) <= limit`` does."""
+    bound = _max_squared_distance(limit)
+
+    for square in _squared_distances(limit):
+        assert (square <= bound) == (math.sqrt(square) <= limit), square
+
+
+@pytest.mark.parametrize("limit", SPECIAL_LIMITS + ORDINARY_LIMITS)
+def test_min_bound_matches_sqrt_comparison(limit: float) -> None:
+    """``s >= bound`` holds exactly when ``sqrt(s) >= limit`` does."""
+    bound = _min_squared_distance(limit)
+
+    for square in _squared_distances(limit):
+        assert (square >= bound) == (math.sqrt(square) >= limit), square
+
+
+@pytest.mark.parametrize("limit", HUGE_LIMITS)
+def test_huge_limits_use_the_float_square(limit: float) -> None:
+    """Beyond the exact range both bounds are the limit squared as a float."""
+    assert limit > _EXACT_SQUARE_LIMIT
+
+    assert _max_squared_distance(limit) == limit * limit
+    assert _min_squared_distance(limit) == limit * limit
+
+
+@pytest.mark.parametrize("limit", HUGE_LIMITS)
+def test_huge_limits_validate_grid_connections(limit: float) -> None:
+    """Constraints with huge limits accept or reject every grid connection."""
+    grid = Grid(3, 3)
+    point1, point2 = grid.get_point(0, 0), grid.get_point(2, 2)
+
+    assert MaxDistanceConstraint(limit, enabled=True).validate(grid, point1, point2)
+    assert not MinDistanceConstraint(limit, enabled=True).validate(grid, point1, point2)
+
+
+def test_overflowing_square_becomes_constant_inline_check() -> None:
+    """A limit whose square overflows is treated like an infinite one."""
+    assert MaxDistanceConstraint(1e200).get_inline_check() == "True"
+    assert MinDistanceConstraint(1e200).get_inline_check() == "False"
+
+
+def test_nan_limits_reject_every_connection() -> None:
+    """A NaN limit makes no distance comparison succeed."""
+    assert MaxDistanceConstraint(math.nan).get_inline_check() == "False"
+    assert MinDistanceConstraint(math.nan).get_inline_check() == "False"
+
+
+def test_negative_limits() -> None:
+    """A negative maximum rejects everything and a negative minimum nothing."""
+    assert _max_squared_distance(-1.0) == -1
+    assert _min_squared_distance(-1.0) == 0
@@ -0,0 +1,130 @@
+"""Tests for the non-crossing constraint against brute-force geometry."""
+
+import itertools
+import random
+from typing import List, Tuple
+
+import pytest
+
+from src.constraints.non_crossing import NonCrossingConstraint
+from src.models.grid import Grid
+from src.models.point import Point
+
+Segment = Tuple[Point, Point]
+
+LATTICE_SIZE = 4
+
+
+def _orientation(a: Point, b: Point, c: Point) -> int:
+    """Get the sign of the turn a -> b -> c."""
+    cross = (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x)
+    return (cross > 0) - (cross < 0)
+
+
+def _on_segment(a: Point, b: Point, c: Point) -> bool:
+    """Check whether c, collinear with a and b, lies within their extent."""
+    return min(a.x, b.x) <= c.x <= max(a.x, b.x) and min(a.y, b.y) <= c.y <= max(
+        a.y, b.y
+    )
+
+
+def _crosses(first: Segment, second: Segment) -> bool:
+    """Check two segments for intersection the textbook way.
+
+    Segments that share an endpoint may meet there, as the constraint allows.
+    """
+    p1, p2 = first
+    p3, p4 = second
+    if {p1, p2} & {p3, p4}:
+        return False
+    d1 = _orientation(p3, p4, p1)
+    d2 = _orientation(p3, p4, p2)
+    d3 = _orientation(p1, p2, p3)
+    d4 = _orientation(p1, p2, p4)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+    return (
+        (d1 == 0 and _on_segment(p3, p4, p1))
+        or (d2 == 0 and _on_segment(p3, p4, p2))
+        or (d3 == 0 and _on_segment(p1, p2, p3))
+        or (d4 == 0 and _on_segment(p1, p2, p4))
+    )
+
+
+@pytest.fixture
+def grid() -> Grid:
+    """Provide a small grid whose points make up the test lattice."""
+    return Grid(LATTICE_SIZE, LATTICE_SIZE)
+
+
+def _all_segments(grid: Grid) -> List[Segment]:
+    """Get every segment between two distinct lattice points, in both directions."""
+    return list(itertools.permutations(grid.get_all_points(), 2))
+
+
+def test_single_tracked_connection_matches_brute_force(grid: Grid) -> None:
+    """Every segment pair on the lattice agrees with the geometric test."""
+    segments = _all_segments(grid)
+
+    for tracked in segments:
+        constraint = NonCrossingConstraint()
+        constraint.add_connection(*tracked)
+        for candidate in segments:
+            expected = not _crosses(tracked, candidate)
+            assert constraint.validate(grid, *candidate) == expected, (
+                tracked,
+                candidate,
+            )
+
+
+def test_unit_step_layouts_match_brute_force(grid: Grid) -> None:
+    """Random sets of neighbor steps, as the grid creates, agree with brute force."""
+    rng = random.Random(0)
+    unit_steps = [
+        (point, neighbor)
+        for point in grid.get_all_points()
+        for neighbor in grid.get_neighbors(point)
+    ]
+    segments = _all_segments(grid)
+
+    for _ in range(200):
+        tracked = rng.sample(unit_steps, rng.randint(1, 8))
+        constraint = NonCrossingConstraint()
+        for segment in tracked:
+            constraint.add_connection(*segment)
+        for candidate in segments:
+            expected = not any(_crosses(segment, candidate) for segment in tracked)
+            assert constraint.validate(grid, *candidate) == expected
+
+
+def test_mixed_layouts_match_brute_force_after_removal(grid: Grid) -> None:
+    """Tracking stays exact when arbitrary connections are added and removed."""
+    rng = random.Random(1)
+    segments = _all_segments(grid)
+    # Each connection once, as the constraint treats both directions alike
+    connections = list(itertools.combinations(grid.get_all_points(), 2))
+
+    for _ in range(100):
+        tracked = rng.sample(connections, 6)
+        constraint = NonCrossingConstraint()
+        for segment in tracked:
+            constraint.add_connection(*segment)
+        removed = tracked.pop(rng.randrange(len(tracked)))
+        assert constraint.remove_connection(*removed)
+        for candidate in segments:
+            expected = not any(_crosses(segment, candidate) for segment in tracked)
+            assert constraint.validate(grid, *candidate) == expected
+
+
+def test_batch_validation_matches_single_validation(grid: Grid) -> None:
+    """validate_batch gives the same answer as validate for each candidate."""
+    rng = random.Random(2)
+    constraint = NonCrossingConstraint()
+    for segment in rng.sample(_all_segments(grid), 5):
+        constraint.add_connection(*segment)
+    points = grid.get_all_points()
+
+    for point in points:
+        candidates = [other for other in points if other != point]
+        expected = [constraint.validate(grid, point, other) for other in candidates]
+        assert constraint.validate_batch(grid, point, candidates) == expected